@@ -24,6 +24,7 @@ from serena.analytics import RegisteredTokenCountEstimator, ToolUsageStats
 from serena.config.context_mode import RegisteredContext, SerenaAgentContext, SerenaAgentMode
 from serena.config.serena_config import SerenaConfig, ToolInclusionDefinition, ToolSet, get_serena_managed_in_project_dir
 from serena.dashboard import SerenaDashboardAPI
+from serena.dependency_symbol import DependencySymbolRetriever
 from serena.project import Project
 from serena.prompt_factory import SerenaPromptFactory
 from serena.tools import ActivateProjectTool, Tool, ToolMarker, ToolRegistry
@@ -230,6 +231,7 @@ class SerenaAgent:
         self.language_server: SolidLanguageServer | None = None
         self.memories_manager: MemoriesManager | None = None
         self.lines_read: LinesRead | None = None
+        self.dependency_symbol_retriever: DependencySymbolRetriever | None = None
 
         # set the active modes
         if modes is None:
@@ -441,6 +443,8 @@ class SerenaAgent:
         # initialize project-specific instances which do not depend on the language server
         self.memories_manager = MemoriesManager(project.project_root)
         self.lines_read = LinesRead()
+        # shared by all tool calls, such that its in-memory caches are retained between them
+        self.dependency_symbol_retriever = DependencySymbolRetriever(project)
 
         def init_language_server() -> None:
             # start the language server
@@ -2,14 +2,16 @@
 Configuration for dependency symbol search functionality.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List
+import functools
+from dataclasses import dataclass
+from typing import Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DependencySymbolConfig:
     """
     Configuration for dependency symbol search and decompilation.
+    Instances are immutable and hashable, so they can safely be shared and used as cache keys.
     """
     
     # General settings
@@ -35,6 +37,15 @@ class DependencySymbolConfig:
     
     cache_ttl_seconds: int = 3600
     """Time-to-live for cached dependency symbols in seconds."""
+
+    cache_max_entries: int = 256
+    """Maximum number of symbol lists held in memory (one per dependency and body setting); least recently used ones are evicted."""
+
+    disk_cache_dir: Optional[str] = None
+    """Directory in which type enumeration results are persisted across sessions (default: ~/.serena/cache/dependencies)."""
+
+    disk_cache_max_bytes: int = 64 * 1024 * 1024
+    """Size budget of the on-disk cache; least recently used entries are evicted beyond it."""
     
     # Scope settings
     include_nuget_packages: bool = True
@@ -46,6 +57,9 @@ class DependencySymbolConfig:
     include_system_assemblies: bool = False
     """Whether to include symbols from system assemblies (e.g., System.*)."""
     
+    scan_workers: Optional[int] = None
+    """Maximum number of dependencies processed concurrently (default: twice the number of CPUs, at most 32)."""
+    
     # Decompiler backend selection
     decompiler_backend: str = "ilspy"
     """Decompiler backend to use: "ilspy", "cecil", or "auto" (prefers ilspy if available)."""
@@ -54,13 +68,18 @@ class DependencySymbolConfig:
     """Path to the ilspycmd executable."""
 
     # External dependencies search paths
-    external_search_paths: List[str] = field(default_factory=list)
-    """Additional locations to search for external DLLs (relative or absolute)."""
+    external_search_paths: Sequence[str] = ()
+    """Additional locations to search for external DLLs (absolute, or relative to the project root); stored as a tuple."""
 
     # Filter settings
     min_confidence_threshold: float = 0.7
     """Minimum confidence threshold for symbol matching (0.0 to 1.0)."""
     
+    def __post_init__(self) -> None:
+        # accept any sequence (e.g. a list read from a config file) but store a tuple to retain hashability
+        if not isinstance(self.external_search_paths, tuple):
+            object.__setattr__(self, "external_search_paths", tuple(self.external_search_paths))
+
     def validate(self) -> None:
         """Validate the configuration values."""
         if self.max_results < 1:
@@ -69,9 +88,19 @@ class DependencySymbolConfig:
             raise ValueError("decompilation_depth must be between 0 and 2")
         if self.cache_ttl_seconds < 0:
             raise ValueError("cache_ttl_seconds must be non-negative")
+        if self.scan_workers is not None and self.scan_workers < 1:
+            raise ValueError("scan_workers must be at least 1")
+        if self.cache_max_entries < 1:
+            raise ValueError("cache_max_entries must be at least 1")
+        if self.disk_cache_max_bytes < 0:
+            raise ValueError("disk_cache_max_bytes must be non-negative")
         if not 0.0 <= self.min_confidence_threshold <= 1.0:
             raise ValueError("min_confidence_threshold must be between 0.0 and 1.0")
 
 
-# Default configuration
-DEFAULT_DEPENDENCY_CONFIG = DependencySymbolConfig()
\ No newline at end of file
+@functools.cache
+def default_dependency_config() -> DependencySymbolConfig:
+    """
+    :return: the default configuration, which is created on first use and shared (it is immutable)
+    """
+    return DependencySymbolConfig()
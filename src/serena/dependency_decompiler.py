@@ -10,19 +10,50 @@ Note:
 - In a full production environment, ILSpy (ICSharpCode.Decompiler) would be
   used as the primary decompiler backend, likely via a .NET interop bridge.
 - Cecil (Mono.Cecil) can provide metadata-based symbol extraction with no
-  decompilation when depth=0 or minimal bodies are requested.
+  decompilation when depth=0 or minimal bodies are requested. The Cecil backend
+  currently reads the type definitions directly from the memory-mapped assembly
+  (see read_type_definitions) instead of going through a .NET bridge.
 - This Python-based placeholder is designed for integration without hard
   dependencies. It provides a clear extension point for real backends.
 """
+
 from __future__ import annotations
 
+import asyncio
 import logging
+import mmap
+import os
+import struct
 import subprocess
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Optional
 
 log = logging.getLogger(__name__)
 
+_ILSPY_ENV: dict[str, str] = {
+    # decompilation is CPU/GC-bound; server GC roughly halves ILSpy's decompilation time
+    "DOTNET_gcServer": "1",
+    "DOTNET_GCConcurrent": "1",
+    "DOTNET_TieredCompilation": "1",
+    # equivalents honoured by older runtimes
+    "COMPlus_gcServer": "1",
+    "COMPlus_gcConcurrent": "1",
+}
+"""environment variables set for every ilspycmd child process (in addition to the inherited environment)"""
+
+_AssemblyKey = tuple[str, int, int]
+"""identifies a version of an assembly by its path, size and modification time (in nanoseconds)"""
+
+_MAX_MEMOIZED_ASSEMBLIES = 16
+"""maximum number of assemblies whose decompiled bodies are memoized by IlSpyDecompiler"""
+
+TYPE_KINDS = ("Class", "Interface", "Struct", "Delegate", "Enum")
+"""the type kinds reported by decompiler backends (matching ILSpy's TypeKind names)"""
+
 
 class DecompilerBackend(ABC):
     """
@@ -34,13 +65,28 @@ class DecompilerBackend(ABC):
         self.include_private_members = include_private_members
 
     @abstractmethod
-    def enumerate_types(self, assembly_path: str) -> List[str]:
+    def enumerate_types(self, assembly_path: str) -> list[str]:
         """
         Enumerate available type names from the given assembly.
         Returns a list of fully-qualified type names, e.g. "Namespace.Type".
         """
         raise NotImplementedError
 
+    def enumerate_types_with_kinds(self, assembly_path: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Enumerate available types from the given assembly together with their kinds.
+        Returns a list of (fully-qualified type name, kind) pairs, where kind is one of TYPE_KINDS
+        or None if the backend cannot determine it.
+        """
+        return [(type_name, None) for type_name in self.enumerate_types(assembly_path)]
+
+    async def enumerate_types_with_kinds_async(self, assembly_path: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Asynchronous variant of enumerate_types_with_kinds.
+        The default implementation runs the synchronous method in a worker thread.
+        """
+        return await asyncio.to_thread(self.enumerate_types_with_kinds, assembly_path)
+
     @abstractmethod
     def decompile_type_body(self, assembly_path: str, type_name: str) -> str:
         """
@@ -49,52 +95,382 @@ class DecompilerBackend(ABC):
         """
         raise NotImplementedError
 
+    def invalidate(self, assembly_path: str) -> None:
+        """
+        Discard any state memoized for the given assembly, such that it is decompiled anew on next access.
+        The default implementation does nothing (for backends which memoize nothing).
+        """
+
 
 class IlSpyDecompiler(DecompilerBackend):
     """
     ILSpy-based decompiler backend (production-ready integration would wrap the
     .NET ICSharpCode.Decompiler library).
+
+    Type bodies are obtained by decompiling the whole assembly once in project mode
+    (`ilspycmd -p`) and memoizing the per-type sources (for a bounded number of assemblies, and
+    only as long as the assembly file is unchanged), so that an assembly with N types
+    costs a single CLR start instead of N. Single-type decompilation (`ilspycmd -t`) is
+    only used as a fallback if project mode fails.
     """
 
     def __init__(self, ilspycmd_path: str, depth: int = 1, include_private_members: bool = False) -> None:
         super().__init__(depth=depth, include_private_members=include_private_members)
         self.ilspycmd_path = ilspycmd_path
+        self._bodies_cache: OrderedDict[_AssemblyKey, dict[str, str]] = OrderedDict()
+        """
+        maps assembly keys to the bodies of their types (fully-qualified type name -> source), holding the
+        _MAX_MEMOIZED_ASSEMBLIES most recently used assemblies; a rebuilt assembly gets a new key
+        """
+        self._project_decompile_failures: set[_AssemblyKey] = set()
+        """keys of assemblies for which project-mode decompilation failed (such that it is not retried for every type)"""
+        self._assembly_locks: dict[str, threading.Lock] = {}
+        """per-assembly locks, such that concurrent requests for the bodies of an assembly's types trigger a single decompilation"""
+        self._lock = threading.Lock()
+        """guards the memoized bodies, the failures and the creation of per-assembly locks"""
+
+    def _run_ilspycmd(self, *args: str) -> subprocess.CompletedProcess:
+        """Runs ilspycmd with the given arguments, raising CalledProcessError on failure."""
+        cmd = [self.ilspycmd_path, *args]
+        return subprocess.run(cmd, capture_output=True, text=True, check=True, env={**os.environ, **_ILSPY_ENV})
 
-    def enumerate_types(self, assembly_path: str) -> List[str]:
+    def _iter_ilspycmd_output(self, *args: str) -> Iterator[str]:
+        """
+        Runs ilspycmd with the given arguments and yields its output line by line while it is being produced,
+        such that large outputs are never buffered as a whole.
+
+        :raises CalledProcessError: if ilspycmd terminates with a non-zero exit code (after all output was consumed)
+        """
+        cmd = [self.ilspycmd_path, *args]
+        # stderr goes to a file rather than a pipe, which could fill up (and block ilspycmd) while stdout is consumed
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, env={**os.environ, **_ILSPY_ENV}) as proc:
+                assert proc.stdout is not None
+                yield from proc.stdout
+                return_code = proc.wait()
+            if return_code != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(return_code, cmd, stderr=stderr_file.read())
+
+    def enumerate_types(self, assembly_path: str) -> list[str]:
         """Enumerates types using `ilspycmd -l`."""
-        cmd = [self.ilspycmd_path, "-l", "c,i,s,d,e", assembly_path]
+        return [type_name for type_name, _ in self.enumerate_types_with_kinds(assembly_path)]
+
+    def enumerate_types_with_kinds(self, assembly_path: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Enumerates types and their kinds using `ilspycmd -l`, which prints lines of the form "<Kind> <FullName>".
+        (The bodies memoized from project-mode decompilation are not used here, as they do not convey the types' kinds.)
+        """
+        types: list[tuple[str, Optional[str]]] = []
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            # The output of `ilspycmd -l` is a list of fully qualified type names, one per line.
-            return result.stdout.splitlines()
+            for line in self._iter_ilspycmd_output("-l", "c,i,s,d,e", assembly_path):
+                entry = self._parse_type_listing_line(line)
+                if entry is not None:
+                    types.append(entry)
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             log.error(f"Failed to enumerate types with ilspycmd: {e}")
             return []
+        return types
+
+    async def enumerate_types_with_kinds_async(self, assembly_path: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Enumerates types and their kinds using an asynchronous `ilspycmd -l` child process, such that
+        the type listings of many assemblies can be obtained concurrently without tying up a thread per process.
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.ilspycmd_path,
+                "-l",
+                "c,i,s,d,e",
+                assembly_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, **_ILSPY_ENV},
+            )
+            stdout, stderr = await proc.communicate()
+        except OSError as e:
+            log.error(f"Failed to enumerate types with ilspycmd: {e}")
+            return []
+        if proc.returncode != 0:
+            log.error(f"Failed to enumerate types with ilspycmd (exit code {proc.returncode}): {stderr.decode(errors='replace')}")
+            return []
+        types: list[tuple[str, Optional[str]]] = []
+        for line in stdout.decode(errors="replace").splitlines():
+            entry = self._parse_type_listing_line(line)
+            if entry is not None:
+                types.append(entry)
+        return types
+
+    @staticmethod
+    def _parse_type_listing_line(line: str) -> Optional[tuple[str, Optional[str]]]:
+        """Parses a line of the output of `ilspycmd -l` into a (type name, kind) pair (None for blank lines)."""
+        line = line.strip()
+        if not line:
+            return None
+        kind, _, type_name = line.partition(" ")
+        if kind in TYPE_KINDS and type_name:
+            return type_name.strip(), kind
+        return line, None
 
     def decompile_type_body(self, assembly_path: str, type_name: str) -> str:
+        """
+        Returns the decompiled body of a type, decompiling the whole assembly in project mode on first access.
+        Falls back to `ilspycmd -t` if the type is not contained in the project-mode output.
+        """
+        key = self._get_assembly_key(assembly_path)
+        bodies = self._get_memoized_bodies(key)
+        if bodies is None and key not in self._project_decompile_failures:
+            with self._lock:
+                assembly_lock = self._assembly_locks.setdefault(assembly_path, threading.Lock())
+            with assembly_lock:
+                # another thread may have decompiled the assembly while we were waiting for the lock
+                bodies = self._get_memoized_bodies(key)
+                if bodies is None and key not in self._project_decompile_failures:
+                    bodies = self._run_project_decompile(assembly_path)
+                    with self._lock:
+                        if bodies is not None:
+                            self._bodies_cache[key] = bodies
+                            while len(self._bodies_cache) > _MAX_MEMOIZED_ASSEMBLIES:
+                                self._bodies_cache.popitem(last=False)
+                        else:
+                            self._project_decompile_failures.add(key)
+        if bodies is not None and type_name in bodies:
+            return bodies[type_name]
+        return self._decompile_single_type(assembly_path, type_name)
+
+    def invalidate(self, assembly_path: str) -> None:
+        with self._lock:
+            for key in [key for key in self._bodies_cache if key[0] == assembly_path]:
+                del self._bodies_cache[key]
+            self._project_decompile_failures = {key for key in self._project_decompile_failures if key[0] != assembly_path}
+
+    @staticmethod
+    def _get_assembly_key(assembly_path: str) -> _AssemblyKey:
+        """Computes the key of an assembly's memoized bodies, which changes whenever the assembly is rebuilt."""
+        try:
+            stat = os.stat(assembly_path)
+        except OSError:
+            # decompilation will fail (and be reported) for an unreadable assembly
+            return assembly_path, 0, 0
+        return assembly_path, stat.st_size, stat.st_mtime_ns
+
+    def _get_memoized_bodies(self, key: _AssemblyKey) -> Optional[dict[str, str]]:
+        with self._lock:
+            bodies = self._bodies_cache.get(key)
+            if bodies is not None:
+                self._bodies_cache.move_to_end(key)
+            return bodies
+
+    def _run_project_decompile(self, assembly_path: str) -> Optional[dict[str, str]]:
+        """
+        Decompiles the entire assembly with a single `ilspycmd -p` invocation.
+
+        :return: a mapping from fully-qualified type names to their decompiled source, or None if decompilation failed
+        """
+        with tempfile.TemporaryDirectory(prefix="serena_ilspy_") as output_dir:
+            try:
+                self._run_ilspycmd("-p", "-o", output_dir, assembly_path)
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                log.warning(f"Project-mode decompilation of {assembly_path} failed, falling back to per-type decompilation: {e}")
+                return None
+            return self._read_project_output(output_dir)
+
+    @staticmethod
+    def _read_project_output(output_dir: str) -> dict[str, str]:
+        """
+        Collects the type sources written by `ilspycmd -p`. The project layout places each top-level type in
+        `<Namespace>/<TypeName>.cs` (types in the global namespace reside in the root directory).
+        """
+        bodies: dict[str, str] = {}
+        for root, dirs, files in os.walk(output_dir):
+            # assembly attributes are not types
+            dirs[:] = [d for d in dirs if d != "Properties"]
+            rel_dir = os.path.relpath(root, output_dir)
+            namespace = "" if rel_dir == os.curdir else rel_dir.replace(os.sep, ".")
+            for file in files:
+                type_name, ext = os.path.splitext(file)
+                if ext not in (".cs", ".il"):
+                    continue
+                fqn = f"{namespace}.{type_name}" if namespace else type_name
+                with open(os.path.join(root, file), encoding="utf-8", errors="replace") as f:
+                    bodies[fqn] = f.read()
+        return bodies
+
+    def _decompile_single_type(self, assembly_path: str, type_name: str) -> str:
         """Decompiles a single type using `ilspycmd -t`."""
-        cmd = [self.ilspycmd_path, "-t", type_name, assembly_path]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = self._run_ilspycmd("-t", type_name, assembly_path)
             return result.stdout
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             log.error(f"Failed to decompile type {type_name} with ilspycmd: {e}")
             return f"// Failed to decompile {type_name}"
 
 
+# Metadata table numbers (ECMA-335, II.22)
+_TABLE_MODULE = 0x00
+_TABLE_TYPE_REF = 0x01
+_TABLE_TYPE_DEF = 0x02
+_TABLE_FIELD = 0x04
+_TABLE_METHOD_DEF = 0x06
+_TABLE_MODULE_REF = 0x1A
+_TABLE_TYPE_SPEC = 0x1B
+_TABLE_ASSEMBLY_REF = 0x23
+
+_TYPE_ATTR_VISIBILITY_MASK = 0x07
+_TYPE_ATTR_PUBLIC = 0x01
+_TYPE_ATTR_INTERFACE = 0x20
+
+_BASE_TYPE_KINDS = {"System.Enum": "Enum", "System.ValueType": "Struct", "System.MulticastDelegate": "Delegate"}
+
+
+def read_type_definitions(data: bytes | mmap.mmap, include_non_public: bool = False) -> list[tuple[str, Optional[str]]]:
+    """
+    Reads the top-level type definitions from the ECMA-335 metadata of a .NET assembly.
+
+    The reader works on the raw image (typically a memory-mapped file), such that the metadata tables are
+    accessed by slicing instead of issuing a read call per row. Nested and compiler-generated types are skipped.
+
+    :param data: the contents of the assembly file
+    :param include_non_public: whether to include types which are not public
+    :return: a list of (fully-qualified type name, kind) pairs, with kinds as in TYPE_KINDS
+    :raises ValueError: if the data is not a valid .NET assembly
+    """
+    try:
+        # PE/COFF headers and section table
+        pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
+        if data[pe_offset : pe_offset + 4] != b"PE\0\0":
+            raise ValueError("Not a PE image")
+        (num_sections,) = struct.unpack_from("<H", data, pe_offset + 6)
+        (optional_header_size,) = struct.unpack_from("<H", data, pe_offset + 20)
+        optional_header = pe_offset + 24
+        (magic,) = struct.unpack_from("<H", data, optional_header)
+        data_directories = optional_header + (96 if magic == 0x10B else 112)
+        cli_header_rva, _ = struct.unpack_from("<II", data, data_directories + 14 * 8)
+        if cli_header_rva == 0:
+            raise ValueError("Not a .NET assembly (no CLI header)")
+        sections = [struct.unpack_from("<IIII", data, optional_header + optional_header_size + i * 40 + 8) for i in range(num_sections)]
+
+        def rva_to_offset(rva: int) -> int:
+            for virtual_size, virtual_address, raw_size, raw_pointer in sections:
+                if virtual_address <= rva < virtual_address + max(virtual_size, raw_size):
+                    return rva - virtual_address + raw_pointer
+            raise ValueError(f"RVA {rva:#x} is not contained in any section")
+
+        # metadata root and stream headers
+        metadata_rva, _ = struct.unpack_from("<II", data, rva_to_offset(cli_header_rva) + 8)
+        metadata = rva_to_offset(metadata_rva)
+        if struct.unpack_from("<I", data, metadata)[0] != 0x424A5342:
+            raise ValueError("Invalid metadata signature")
+        (version_length,) = struct.unpack_from("<I", data, metadata + 12)
+        pos = metadata + 16 + version_length
+        (num_streams,) = struct.unpack_from("<H", data, pos + 2)
+        pos += 4
+        streams: dict[str, int] = {}
+        for _ in range(num_streams):
+            stream_offset, _ = struct.unpack_from("<II", data, pos)
+            name_end = data.find(b"\0", pos + 8)
+            streams[bytes(data[pos + 8 : name_end]).decode("ascii")] = metadata + stream_offset
+            pos = pos + 8 + ((name_end - pos - 8 + 4) & ~3)
+        tables = streams.get("#~", streams.get("#-"))
+        strings = streams.get("#Strings")
+        if tables is None or strings is None:
+            raise ValueError("Metadata streams are missing")
+
+        # table stream header: determine row counts and index sizes
+        heap_sizes = data[tables + 6]
+        (valid,) = struct.unpack_from("<Q", data, tables + 8)
+        pos = tables + 24
+        rows = [0] * 64
+        for table in range(64):
+            if valid >> table & 1:
+                (rows[table],) = struct.unpack_from("<I", data, pos)
+                pos += 4
+        if heap_sizes & 0x40:
+            pos += 4  # extra data
+        string_index_size = 4 if heap_sizes & 0x01 else 2
+        guid_index_size = 4 if heap_sizes & 0x02 else 2
+
+        def table_index_size(table: int) -> int:
+            return 4 if rows[table] > 0xFFFF else 2
+
+        def coded_index_size(tag_bits: int, *tables: int) -> int:
+            return 4 if max(rows[t] for t in tables) >= 1 << (16 - tag_bits) else 2
+
+        resolution_scope_size = coded_index_size(2, _TABLE_MODULE, _TABLE_MODULE_REF, _TABLE_ASSEMBLY_REF, _TABLE_TYPE_REF)
+        type_def_or_ref_size = coded_index_size(2, _TABLE_TYPE_DEF, _TABLE_TYPE_REF, _TABLE_TYPE_SPEC)
+        module_row_size = 2 + string_index_size + 3 * guid_index_size
+        type_ref_row_size = resolution_scope_size + 2 * string_index_size
+        type_def_row_size = (
+            4 + 2 * string_index_size + type_def_or_ref_size + table_index_size(_TABLE_FIELD) + table_index_size(_TABLE_METHOD_DEF)
+        )
+        type_ref_start = pos + rows[_TABLE_MODULE] * module_row_size
+        type_def_start = type_ref_start + rows[_TABLE_TYPE_REF] * type_ref_row_size
+
+        def read_index(offset: int, size: int) -> int:
+            return struct.unpack_from("<I" if size == 4 else "<H", data, offset)[0]
+
+        def read_string(offset: int) -> str:
+            start = strings + read_index(offset, string_index_size)
+            return bytes(data[start : data.find(b"\0", start)]).decode("utf-8")
+
+        def full_name(name_offset: int) -> str:
+            # strip the generic arity suffix (e.g. "List`1"), as in ILSpy's type names
+            name = read_string(name_offset).partition("`")[0]
+            namespace = read_string(name_offset + string_index_size)
+            return f"{namespace}.{name}" if namespace else name
+
+        def base_type_name(extends: int) -> Optional[str]:
+            tag, row = extends & 0x3, extends >> 2
+            if row == 0:
+                return None
+            if tag == 0:
+                return full_name(type_def_start + (row - 1) * type_def_row_size + 4)
+            if tag == 1:
+                return full_name(type_ref_start + (row - 1) * type_ref_row_size + resolution_scope_size)
+            return None  # TypeSpec (generic instantiation)
+
+        types: list[tuple[str, Optional[str]]] = []
+        for row in range(rows[_TABLE_TYPE_DEF]):
+            offset = type_def_start + row * type_def_row_size
+            (flags,) = struct.unpack_from("<I", data, offset)
+            visibility = flags & _TYPE_ATTR_VISIBILITY_MASK
+            if visibility > _TYPE_ATTR_PUBLIC or (visibility != _TYPE_ATTR_PUBLIC and not include_non_public):
+                continue  # nested or non-public type
+            type_name = full_name(offset + 4)
+            if "<" in type_name:
+                continue  # <Module> and compiler-generated types
+            if flags & _TYPE_ATTR_INTERFACE:
+                kind = "Interface"
+            else:
+                base_type = base_type_name(read_index(offset + 4 + 2 * string_index_size, type_def_or_ref_size))
+                kind = _BASE_TYPE_KINDS.get(base_type or "", "Class")
+                if kind != "Class" and type_name in _BASE_TYPE_KINDS:
+                    kind = "Class"  # System.Enum itself derives from System.ValueType
+            types.append((type_name, kind))
+        return types
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed assembly metadata: {e}") from e
+
+
 class CecilDecompiler(DecompilerBackend):
     """
-    Mono.Cecil-based decompiler (metadata-based). This is a placeholder backend
-    for environments where decompilation is not desired or available at runtime.
+    Metadata-based backend (named after Mono.Cecil, which a .NET bridge would use). Types are enumerated
+    by reading the assembly's metadata tables from a memory-mapped file; type bodies are not decompiled.
     """
 
     def __init__(self, depth: int = 1, include_private_members: bool = False) -> None:
         super().__init__(depth=depth, include_private_members=include_private_members)
 
-    def enumerate_types(self, assembly_path: str) -> List[str]:
-        log.info("CecilDecompiler: enumerate_types called for %s", assembly_path)
-        # Placeholder: real implementation would read metadata via Cecil
-        return []
+    def enumerate_types(self, assembly_path: str) -> list[str]:
+        return [type_name for type_name, _ in self.enumerate_types_with_kinds(assembly_path)]
+
+    def enumerate_types_with_kinds(self, assembly_path: str) -> list[tuple[str, Optional[str]]]:
+        try:
+            with open(assembly_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return read_type_definitions(mm, include_non_public=self.include_private_members)
+        except (OSError, ValueError) as e:
+            log.error(f"Failed to read types from {assembly_path}: {e}")
+            return []
 
     def decompile_type_body(self, assembly_path: str, type_name: str) -> str:
-        return f"// Decompiled body of {type_name} from {assembly_path} [Cecil placeholder]"
\ No newline at end of file
+        return f"// Decompiled body of {type_name} from {assembly_path} [Cecil placeholder]"
@@ -2,33 +2,394 @@
 Dependency symbol retrieval for external libraries and NuGet packages.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
-import tempfile
+import sys
+import threading
+import time
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Collection, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING, Any, Optional
 
+from serena.config.dependency_config import DependencySymbolConfig, default_dependency_config
+from serena.constants import SERENA_MANAGED_DIR_IN_HOME
 from serena.project import Project
-from serena.config.dependency_config import DependencySymbolConfig, DEFAULT_DEPENDENCY_CONFIG
-from serena.symbol import LanguageServerSymbol, LanguageServerSymbolLocation
-from serena.dependency_decompiler import DecompilerBackend, IlSpyDecompiler, CecilDecompiler
-from solidlsp.ls_types import SymbolKind
+from serena.symbol import LanguageServerSymbol
+from solidlsp.ls_types import Location, Position, Range, SymbolKind, UnifiedSymbolInformation
+from solidlsp.ls_utils import PathUtils
+
+if TYPE_CHECKING:
+    from serena.dependency_decompiler import DecompilerBackend
 
 log = logging.getLogger(__name__)
 
+SymbolMatcher = Callable[[str, SymbolKind], bool]
+"""a predicate on a symbol's case-folded name and kind"""
+
+_CacheKey = tuple[str, str, str, Optional[str], int, int, bool]
+"""the key of cached symbols: dependency type, name, version, path, size, modification time and whether bodies are included"""
+
+_KIND_TO_SYMBOL_KIND = {
+    "Class": SymbolKind.Class,
+    "Interface": SymbolKind.Interface,
+    "Struct": SymbolKind.Struct,
+    "Delegate": SymbolKind.Class,
+    "Enum": SymbolKind.Enum,
+}
+"""maps the type kinds reported by decompiler backends to symbol kinds (types of unknown kind are treated as classes)"""
+
+_ZERO_POSITION = Position(line=0, character=0)
+_ZERO_RANGE = Range(start=_ZERO_POSITION, end=_ZERO_POSITION)
+"""the (shared, read-only) range used for all dependency symbols, which have no actual source location"""
+
+_COMMON_TYPES = tuple(
+    (namespace, type_name, kind, namespace.lower(), type_name.lower())
+    for namespace, type_name, kind in (
+        ("System", "Console", SymbolKind.Class),
+        ("System", "String", SymbolKind.Class),
+        ("System", "Int32", SymbolKind.Class),
+        ("System.Collections", "List", SymbolKind.Class),
+        ("System.Collections.Generic", "Dictionary", SymbolKind.Class),
+    )
+)
+"""the common System types for which placeholder symbols are created (namespace, type name, kind and the lower-case names)"""
+
+_COMMON_TYPE_NAMES = frozenset(type_name.casefold() for _, type_name, _, _, _ in _COMMON_TYPES)
+"""the case-folded names of the common System types"""
+
+_SKIP_DIRS = frozenset({".git", "node_modules", "obj", ".vs", ".idea", ".serena"})
+"""names of directories which are never searched for project files or DLLs"""
+
+_DLL_SKIP_DIRS = _SKIP_DIRS | {"runtimes"}
+"""names of directories which are not searched for DLLs (runtimes/ holds platform-specific duplicates of NuGet assemblies)"""
+
+_SYSTEM_ASSEMBLY_PREFIXES = (
+    "System.",
+    "Microsoft.CSharp",
+    "Microsoft.VisualBasic",
+    "Microsoft.Win32.",
+    "mscorlib",
+    "netstandard",
+    "WindowsBase",
+    "PresentationCore",
+    "PresentationFramework",
+)
+"""file name prefixes of .NET base class library assemblies"""
+
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+"""
+default maximum number of dependencies processed concurrently (see DependencySymbolConfig.scan_workers);
+the work is dominated by waiting on decompiler subprocesses
+"""
+
+_DECOMPILER_BACKENDS = ("ilspy", "cecil", "auto")
+"""the supported values of DependencySymbolConfig.decompiler_backend"""
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DependencyInfo:
-    """Information about a project dependency."""
+    """
+    Information about a project dependency (slotted, as large solutions have hundreds of them).
+    Instances are immutable and hashable; use dataclasses.replace to derive modified instances.
+    """
     
     name: str
     version: str
     type: str  # "nuget", "dll", "project"
     path: Optional[str] = None
     assembly_name: Optional[str] = None
+    size: int = 0
+    """the file size in bytes (for DLLs; 0 if unknown)"""
+    mtime_ns: int = 0
+    """the file modification time in nanoseconds (for DLLs; 0 if unknown)"""
+
+    def exists(self) -> bool:
+        """Whether the dependency's file exists, trusting the file information recorded at discovery if available."""
+        if self.path is None:
+            return False
+        return self.size > 0 or os.path.exists(self.path)
+
+
+def _simple_type_name(type_name: str) -> str:
+    """Strips the namespace from a fully-qualified type name."""
+    return type_name.rsplit(".", 1)[-1]
+
+
+def _scan_files(
+    path: str, suffix: str, skip_dirs: frozenset[str] = _SKIP_DIRS, exclude_prefixes: tuple[str, ...] = ()
+) -> Iterator[os.DirEntry]:
+    """
+    Yields the files below the given directory whose names end with the given suffix,
+    pruning the given directories and not following symbolic links to directories.
+    Directories are traversed with an explicit stack rather than recursively, such that yielded entries
+    do not pass through a chain of nested generators in deep trees.
+
+    :param path: the directory to scan
+    :param suffix: the file name suffix
+    :param skip_dirs: names of directories which are not descended into
+    :param exclude_prefixes: file name prefixes of files to exclude (checked before the file is stat-ed)
+    """
+    pending_dirs = [path]
+    while pending_dirs:
+        dir_path = pending_dirs.pop()
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in skip_dirs:
+                            subdirs.append(entry.path)
+                    elif name.endswith(suffix) and not name.startswith(exclude_prefixes) and entry.is_file():
+                        yield entry
+        except OSError as e:
+            log.debug(f"Cannot scan directory {dir_path}: {e}")
+        # visit the subdirectories in the order in which they were listed
+        pending_dirs.extend(reversed(subdirs))
+
+
+_TFM_PATTERN = re.compile(r"(netcoreapp|netstandard|net)(\d+)(?:\.(\d+))?(?:-.*)?")
+"""matches NuGet target framework monikers such as net8.0, net8.0-windows, netcoreapp3.1, netstandard2.0 and net472"""
+
+
+def _nuget_packages_root() -> Path:
+    """The root of the global NuGet packages folder (overridable via the NUGET_PACKAGES environment variable)."""
+    return Path(os.environ.get("NUGET_PACKAGES") or Path.home() / ".nuget" / "packages")
+
+
+def _tfm_rank(tfm: str, project_tfms: frozenset[str]) -> tuple[bool, int, int, int]:
+    """
+    Ranks a target framework folder of a NuGet package: frameworks targeted by the project come first;
+    otherwise, .NET (Core) is preferred over .NET Standard and .NET Framework, and newer versions over older ones.
+    """
+    tfm = tfm.lower()
+    m = _TFM_PATTERN.fullmatch(tfm)
+    if m is None:
+        return tfm in project_tfms, 0, 0, 0
+    family, major, minor = m.group(1), int(m.group(2)), int(m.group(3) or 0)
+    if family == "netcoreapp" or (family == "net" and m.group(3) is not None):
+        family_rank = 3
+    elif family == "netstandard":
+        family_rank = 2
+    else:
+        family_rank = 1  # .NET Framework (e.g. net472)
+    return tfm in project_tfms, family_rank, major, minor
+
+
+def _normalize_nuget_version(version: str) -> str:
+    """
+    Normalizes a package version the way NuGet does for the folder names of the global packages folder,
+    e.g. "1.0" -> "1.0.0", "1.2.3.0" -> "1.2.3", "01.2.3-Beta+abc" -> "1.2.3-beta".
+    Versions which cannot be parsed (e.g. ranges or floating versions) are only lower-cased.
+    """
+    release, _, prerelease = version.strip().partition("+")[0].partition("-")
+    try:
+        parts = [int(part) for part in release.split(".")]
+    except ValueError:
+        return version.lower()
+    if not 1 <= len(parts) <= 4:
+        return version.lower()
+    parts += [0] * (3 - len(parts))
+    if len(parts) == 4 and parts[3] == 0:
+        parts.pop()
+    normalized = ".".join(map(str, parts))
+    return f"{normalized}-{prerelease}".lower() if prerelease else normalized
+
+
+def _find_nuget_assembly(nuget_root: Path, name: str, version: str, project_tfms: frozenset[str] = frozenset()) -> Optional[str]:
+    """
+    Locates the assembly of a NuGet package in the global packages folder, i.e. lib/<tfm>/<name>.dll,
+    choosing the best matching target framework.
+    Version ranges and floating versions (e.g. "[1.0,2.0)" or "1.*") are not resolved, so such packages are not found.
+
+    :param nuget_root: the root of the global packages folder
+    :param name: the package id
+    :param version: the package version (as referenced, i.e. not necessarily normalized)
+    :param project_tfms: the (lower-case) target frameworks of the referencing projects
+    :return: the path of the assembly or None if the package is not available locally
+    """
+    lib_dir = nuget_root / name.lower() / _normalize_nuget_version(version) / "lib"
+    file_name = f"{name}.dll"
+    try:
+        with os.scandir(lib_dir) as it:
+            tfm_dirs = [entry for entry in it if entry.is_dir()]
+    except OSError:
+        return None
+    # the assembly is almost always located directly in the framework folder, so check these paths first
+    for tfm_dir in sorted(tfm_dirs, key=lambda entry: _tfm_rank(entry.name, project_tfms), reverse=True):
+        candidate = os.path.join(tfm_dir.path, file_name)
+        if os.path.isfile(candidate):
+            return candidate
+    # fall back to searching the entire lib folder for unusual package layouts
+    candidate_path = next(iter(sorted(lib_dir.rglob(file_name))), None)
+    return str(candidate_path) if candidate_path is not None else None
+
+
+class _DiskCache:
+    """
+    A simple persistent cache storing one JSON file per key, such that results survive server restarts.
+    Entries expire after a time-to-live, and the least recently used entries are evicted once the
+    total size exceeds the configured budget.
+    """
+
+    EVICTION_TARGET_RATIO = 0.9
+    """fraction of the size budget to which the cache is shrunk by an eviction (such that evictions are not triggered by every write)"""
+    STALE_TMP_FILE_SECONDS = 3600
+    """age after which temporary files left behind by interrupted writes are removed"""
+
+    def __init__(self, cache_dir: str, ttl_seconds: int, max_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._total_size: Optional[int] = None
+        """
+        the (approximate) total size of the entries, which is determined by a directory scan on the first write
+        and then tracked incrementally, such that the directory is only scanned again once the budget is exceeded
+        """
+        self._size_lock = threading.Lock()
+
+    @staticmethod
+    def file_key(path: str, size: int, mtime_ns: int, *discriminators: str) -> str:
+        """
+        Computes a cache key for the given file which changes whenever the file does; it is based on the
+        file's size, modification time and leading bytes rather than on its full content.
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(size.to_bytes(8, "little"))
+        h.update(mtime_ns.to_bytes(8, "little"))
+        with open(path, "rb") as f:
+            h.update(f.read(4096))
+        for d in discriminators:
+            h.update(d.encode())
+        return h.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] > self.ttl_seconds:
+                os.remove(path)
+                return None
+            # the modification time serves as the access time for LRU eviction (atime is unreliable)
+            os.utime(path)
+            return entry["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            log.warning(f"Ignoring unreadable dependency cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._entry_path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            payload = json.dumps({"created": time.time(), "value": value}).encode("utf-8")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            with self._size_lock:
+                # replacing an existing entry overestimates the total size, which merely advances the next scan
+                if self._total_size is not None and self._total_size + len(payload) <= self.max_bytes:
+                    self._total_size += len(payload)
+                else:
+                    self._total_size = self._evict()
+        except OSError as e:
+            log.warning(f"Failed to write dependency cache entry {path}: {e}")
+
+    def _evict(self) -> int:
+        """
+        Scans the cache directory, removing stale temporary files and, if the cache exceeds its size budget,
+        the least recently used entries until the cache has shrunk to EVICTION_TARGET_RATIO of the budget.
+
+        :return: the total size of the remaining entries
+        """
+        entries = []
+        total_size = 0
+        stale_tmp_time = time.time() - self.STALE_TMP_FILE_SECONDS
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                    if entry.name.endswith(".json"):
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total_size += st.st_size
+                    elif entry.name.endswith(".tmp") and st.st_mtime < stale_tmp_time:
+                        os.remove(entry.path)
+                except OSError:
+                    continue  # removed concurrently
+        if total_size <= self.max_bytes:
+            return total_size
+        target_size = self.max_bytes * self.EVICTION_TARGET_RATIO
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            if total_size <= target_size:
+                break
+        return total_size
+
+
+class _SymbolIndex:
+    """
+    An index over the types enumerated from decompilable dependencies, which is built once and then
+    answers exact name queries via a dictionary lookup and substring queries via a trigram index
+    (instead of scanning all types for every query).
+    """
+
+    def __init__(self, entries: list[tuple[DependencyInfo, str, SymbolKind]], dependency_types: frozenset[str] = frozenset()) -> None:
+        self.entries = entries
+        """the indexed (dependency, fully-qualified type name, kind) triples"""
+        self.dependency_types = dependency_types
+        """the dependency types (e.g. "dll") whose decompilable dependencies are indexed"""
+        self.folded_names: list[str] = []
+        """the case-folded simple type names of the entries (interned, as many types share the same simple name)"""
+        self._ids_by_name: dict[str, list[int]] = defaultdict(list)
+        self._ids_by_trigram: dict[str, set[int]] = defaultdict(set)
+        for entry_id, (_, type_name, _) in enumerate(entries):
+            name = sys.intern(_simple_type_name(type_name).casefold())
+            self.folded_names.append(name)
+            self._ids_by_name[name].append(entry_id)
+            for i in range(len(name) - 2):
+                self._ids_by_trigram[name[i : i + 3]].add(entry_id)
+
+    def query(self, name: str, substring_matching: bool) -> Sequence[int]:
+        """
+        Returns the ids of the candidate entries for the given (simple) type name query, in index order.
+        Candidates are a superset of the matches and must still be verified by the caller.
+        """
+        needle = name.casefold()
+        if not substring_matching:
+            return self._ids_by_name.get(needle, [])
+        if len(needle) < 3:
+            # every entry is a candidate; a range is consumed lazily, such that callers stopping early do not pay for all entries
+            return range(len(self.entries))
+        trigram_ids: list[set[int]] = []
+        for i in range(len(needle) - 2):
+            ids = self._ids_by_trigram.get(needle[i : i + 3])
+            if not ids:
+                return []
+            trigram_ids.append(ids)
+        # intersect starting with the most selective trigram, such that intermediate results stay small
+        trigram_ids.sort(key=len)
+        return sorted(trigram_ids[0].intersection(*trigram_ids[1:]))
 
 
 class DependencySymbolRetriever:
@@ -39,23 +400,79 @@ class DependencySymbolRetriever:
     
     def __init__(self, project: Project, config: Optional[DependencySymbolConfig] = None):
         self.project = project
-        self.config = config or DEFAULT_DEPENDENCY_CONFIG
-        self._dependencies_info: List[DependencyInfo] = []
-        self._dependency_cache: Dict[str, List[LanguageServerSymbol]] = {}
-        self._decompiler = self._get_decompiler()
+        self.config = config or default_dependency_config()
+        self._dependencies_info: list[DependencyInfo] = []
+        self._dependencies_discovered = False
+        """whether dependency discovery has run (such that projects without any dependencies are not re-scanned for every query)"""
+        self._dependency_cache: OrderedDict[_CacheKey, list[LanguageServerSymbol]] = OrderedDict()
+        """the symbols of dependencies in least recently used order, holding at most config.cache_max_entries entries"""
+        self._name_index_cache: dict[_CacheKey, dict[str, list[LanguageServerSymbol]]] = {}
+        """maps the keys of _dependency_cache to the corresponding symbols grouped by case-folded name (for exact-name lookups)"""
+        self._cache_lock = threading.Lock()
+        """guards the symbol caches, which are accessed by the worker threads of a search"""
+        self._types_cache: dict[str, list[tuple[str, SymbolKind]]] = {}
+        """maps DLL paths to the (fully-qualified name, kind) pairs of the types they contain"""
+        self._symbol_templates: dict[str, UnifiedSymbolInformation] = {}
+        """maps dependency names to the template from which the dependency's symbols are created"""
+        self._symbol_index: Optional[_SymbolIndex] = None
+        """
+        index over the types of the decompilable dependencies, built lazily on the first query and extended once a query
+        includes further dependency types
+        """
+        self._project_file_cache: dict[str, tuple[int, list[tuple[str, str]], list[str]]] = {}
+        """
+        maps project file paths to (modification time, package references as (name, version) pairs, target frameworks);
+        unlike the other caches, it is retained by clear_cache, as entries are validated against the file's modification time
+        """
+        self._disk_cache: Optional[_DiskCache] = None
+        if self.config.cache_enabled:
+            self._disk_cache = _DiskCache(
+                self.config.disk_cache_dir or os.path.join(SERENA_MANAGED_DIR_IN_HOME, "cache", "dependencies"),
+                ttl_seconds=self.config.cache_ttl_seconds,
+                max_bytes=self.config.disk_cache_max_bytes,
+            )
         
     def clear_cache(self) -> None:
         """Clear the cached dependency symbols."""
         self._dependency_cache.clear()
+        self._name_index_cache.clear()
+        self._types_cache.clear()
+        self._symbol_index = None
         self._dependencies_info.clear()
+        self._dependencies_discovered = False
+        # drop the decompiler backend along with the type bodies it memoized
+        self.__dict__.pop("_decompiler", None)
+
+    def purge(self, dependency_name: str) -> None:
+        """
+        Remove all cached data of the dependencies with the given name (e.g. after a package was updated),
+        including the type bodies memoized by the decompiler backend, retaining the cached data of all other dependencies.
+        """
+        with self._cache_lock:
+            for key in [key for key in self._dependency_cache if key[1] == dependency_name]:
+                del self._dependency_cache[key]
+                self._name_index_cache.pop(key, None)
+        # only a decompiler backend which was already created can hold memoized state
+        decompiler: Optional["DecompilerBackend"] = self.__dict__.get("_decompiler")
+        for dependency in self._dependencies_info:
+            if dependency.name == dependency_name and dependency.path is not None:
+                self._types_cache.pop(dependency.path, None)
+                if decompiler is not None:
+                    decompiler.invalidate(dependency.path)
+        self._symbol_templates.pop(dependency_name, None)
+        self._symbol_index = None
+
+    def invalidate_parse_cache(self) -> None:
+        """Clear the cached parse results of project files, forcing all project files to be re-parsed on the next discovery."""
+        self._project_file_cache.clear()
         
-    def list_dependencies(self) -> List[Dict[str, Any]]:
+    def list_dependencies(self) -> list[dict[str, Any]]:
         """
         List all project dependencies that can be searched for symbols.
         
         :return: List of dependency information dictionaries
         """
-        if not self._dependencies_info:
+        if self._needs_discovery():
             self._discover_dependencies()
             
         return [
@@ -73,12 +490,12 @@ class DependencySymbolRetriever:
         self,
         name_path: str,
         include_body: bool = False,
-        include_kinds: Optional[Sequence[SymbolKind]] = None,
-        exclude_kinds: Optional[Sequence[SymbolKind]] = None,
+        include_kinds: Optional[Collection[SymbolKind]] = None,
+        exclude_kinds: Optional[Collection[SymbolKind]] = None,
         substring_matching: bool = False,
         include_nuget: bool = True,
         include_external_dlls: bool = True,
-    ) -> List[LanguageServerSymbol]:
+    ) -> list[LanguageServerSymbol]:
         """
         Find symbols in project dependencies matching the given name pattern.
         
@@ -91,34 +508,199 @@ class DependencySymbolRetriever:
         :param include_external_dlls: Include external DLL symbols
         :return: List of matching dependency symbols
         """
-        if not self._dependencies_info:
+        if self._needs_discovery():
             self._discover_dependencies()
             
-        all_symbols: List[LanguageServerSymbol] = []
-        
-        # Get symbols from all dependencies
-        for dep in self._dependencies_info:
-            if (dep.type == "nuget" and not include_nuget) or (dep.type == "dll" and not include_external_dlls):
-                continue
-                
-            symbols = self._get_dependency_symbols(dep, include_body)
-            all_symbols.extend(symbols)
-            
-        # Filter symbols based on search criteria
-        filtered_symbols = []
-        for symbol in all_symbols:
-            if self._matches_search_criteria(symbol, name_path, include_kinds, exclude_kinds, substring_matching):
-                filtered_symbols.append(symbol)
-                
+        eligible_deps = [
+            dep
+            for dep in self._dependencies_info
+            if not ((dep.type == "nuget" and not include_nuget) or (dep.type == "dll" and not include_external_dlls))
+        ]
+        if not eligible_deps:
+            return []
+
+        matcher = self._make_matcher(name_path, include_kinds, exclude_kinds, substring_matching)
+        filtered_symbols: list[LanguageServerSymbol] = []
+        max_results = self.config.max_results
+
+        # the executor materializes matching types and retrieves the symbols of non-decompilable dependencies;
+        # it creates its threads on demand, such that a small search does not start _max_workers threads
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            # Types of decompilable assemblies (external DLLs and locally available NuGet packages) are looked up in the symbol index
+            indexed_types = frozenset(dep.type for dep in eligible_deps if self._is_decompilable(dep))
+            if indexed_types:
+                filtered_symbols.extend(
+                    self._find_indexed_symbols(
+                        executor, name_path, substring_matching, matcher, include_body, max_results, indexed_types
+                    )
+                )
+
+            # Symbols of the remaining dependencies are independent of each other and are therefore retrieved
+            # concurrently; dependencies whose symbols are already cached are handled synchronously instead.
+            # Results are consumed in discovery order to keep the output deterministic, and
+            # pending retrievals are cancelled as soon as enough matches have been collected.
+            other_deps = [dep for dep in eligible_deps if not self._is_decompilable(dep)]
+            if not substring_matching:
+                needle = name_path.casefold()
+                other_deps = [dep for dep in other_deps if self._may_have_symbol_named(dep, needle)]
+            if other_deps and (max_results <= 0 or len(filtered_symbols) < max_results):
+                find_args = (name_path, substring_matching, matcher, include_body, max_results)
+                futures = [
+                    None if self._is_cached(dep, include_body) else executor.submit(self._find_matching_symbols, dep, *find_args)
+                    for dep in other_deps
+                ]
+                for dep, future in zip(other_deps, futures, strict=True):
+                    filtered_symbols.extend(future.result() if future is not None else self._find_matching_symbols(dep, *find_args))
+                    if max_results > 0 and len(filtered_symbols) >= max_results:
+                        for pending in futures:
+                            if pending is not None:
+                                pending.cancel()
+                        break
+
         # Apply max results limit
-        if self.config.max_results > 0 and len(filtered_symbols) > self.config.max_results:
-            filtered_symbols = filtered_symbols[:self.config.max_results]
-                
+        if max_results > 0 and len(filtered_symbols) > max_results:
+            filtered_symbols = filtered_symbols[:max_results]
+
         return filtered_symbols
-        
+
+    async def find_dependency_symbols_async(
+        self,
+        name_path: str,
+        include_body: bool = False,
+        include_kinds: Optional[Collection[SymbolKind]] = None,
+        exclude_kinds: Optional[Collection[SymbolKind]] = None,
+        substring_matching: bool = False,
+        include_nuget: bool = True,
+        include_external_dlls: bool = True,
+    ) -> list[LanguageServerSymbol]:
+        """
+        Asynchronous variant of find_dependency_symbols (with the same parameters).
+        The types of all decompilable dependencies are enumerated concurrently via asynchronous decompiler
+        processes; the search itself is then carried out in a worker thread.
+        """
+        if self._needs_discovery():
+            await asyncio.to_thread(self._discover_dependencies)
+        indexed_types = frozenset(
+            dep.type
+            for dep in self._dependencies_info
+            if self._is_decompilable(dep) and (dep.type != "nuget" or include_nuget) and (dep.type != "dll" or include_external_dlls)
+        )
+        if indexed_types:
+            await self._get_symbol_index_async(indexed_types)
+        return await asyncio.to_thread(
+            self.find_dependency_symbols,
+            name_path,
+            include_body=include_body,
+            include_kinds=include_kinds,
+            exclude_kinds=exclude_kinds,
+            substring_matching=substring_matching,
+            include_nuget=include_nuget,
+            include_external_dlls=include_external_dlls,
+        )
+
+    async def _get_symbol_index_async(self, dependency_types: frozenset[str]) -> _SymbolIndex:
+        """Asynchronous variant of _get_symbol_index, which enumerates the types of at most _max_workers dependencies at a time."""
+        index = self._symbol_index
+        if index is None or not dependency_types <= index.dependency_types:
+            index_types = dependency_types | index.dependency_types if index is not None else dependency_types
+            deps = [dep for dep in self._dependencies_info if dep.type in index_types and self._is_decompilable(dep)]
+            semaphore = asyncio.Semaphore(self._max_workers)
+
+            async def list_types(dep: DependencyInfo) -> list[tuple[str, SymbolKind]]:
+                async with semaphore:
+                    return await self._list_types_async(dep)
+
+            types_per_dep = await asyncio.gather(*(list_types(dep) for dep in deps))
+            index = self._symbol_index = self._build_symbol_index(deps, types_per_dep, index_types)
+        return index
+
+    def _get_symbol_index(self, dependency_types: frozenset[str]) -> _SymbolIndex:
+        """
+        Get the index over the types of the decompilable dependencies of (at least) the given dependency types.
+        Dependencies of other types are not enumerated until a query includes them; the types of the indexed
+        dependencies are enumerated concurrently, using a thread pool sized for the number of these dependencies.
+        """
+        index = self._symbol_index
+        if index is None or not dependency_types <= index.dependency_types:
+            index_types = dependency_types | index.dependency_types if index is not None else dependency_types
+            deps = [dep for dep in self._dependencies_info if dep.type in index_types and self._is_decompilable(dep)]
+            with ThreadPoolExecutor(max_workers=max(1, min(len(deps), self._max_workers))) as executor:
+                types_per_dep = list(executor.map(self._list_types, deps))
+            index = self._symbol_index = self._build_symbol_index(deps, types_per_dep, index_types)
+        return index
+
+    @staticmethod
+    def _build_symbol_index(
+        deps: list[DependencyInfo], types_per_dep: list[list[tuple[str, SymbolKind]]], dependency_types: frozenset[str]
+    ) -> _SymbolIndex:
+        entries = [(dep, type_name, kind) for dep, types in zip(deps, types_per_dep, strict=True) for type_name, kind in types]
+        return _SymbolIndex(entries, dependency_types)
+
+    def _find_indexed_symbols(
+        self,
+        executor: Executor,
+        name_path: str,
+        substring_matching: bool,
+        matcher: SymbolMatcher,
+        include_body: bool,
+        max_results: int,
+        dependency_types: frozenset[str],
+    ) -> list[LanguageServerSymbol]:
+        """
+        Find the matching types of decompilable dependencies of the given dependency types via the symbol index.
+        Only the matching types are materialized (and decompiled, if bodies are requested).
+        """
+        index = self._get_symbol_index(dependency_types)
+        matches = []
+        for entry_id in index.query(name_path, substring_matching):
+            dependency, type_name, kind = index.entries[entry_id]
+            if dependency.type in dependency_types and matcher(index.folded_names[entry_id], kind):
+                matches.append((dependency, type_name, kind))
+                if max_results > 0 and len(matches) >= max_results:
+                    break
+        return list(executor.map(lambda m: self._materialize_symbol(m[0], m[1], m[2], include_body), matches))
+
+    def _find_matching_symbols(
+        self,
+        dependency: DependencyInfo,
+        name_path: str,
+        substring_matching: bool,
+        matcher: SymbolMatcher,
+        include_body: bool,
+        max_results: int,
+    ) -> list[LanguageServerSymbol]:
+        """
+        Get the symbols of a single (non-decompilable) dependency which match the search criteria,
+        stopping as soon as max_results matches were found (if max_results is positive).
+        For exact-name searches, only the symbols with the given name are considered.
+        """
+        if substring_matching:
+            symbols = self._get_dependency_symbols(dependency, include_body)
+        else:
+            symbols = self._get_dependency_name_index(dependency, include_body).get(name_path.casefold(), [])
+        matches = (symbol for symbol in symbols if matcher((symbol.name or "").casefold(), symbol.symbol_kind))
+        return list(islice(matches, max_results)) if max_results > 0 else list(matches)
+
+    @staticmethod
+    def _may_have_symbol_named(dependency: DependencyInfo, folded_name: str) -> bool:
+        """
+        Whether a (non-decompilable) dependency may have a symbol with the given case-folded name, judging from
+        the names of the placeholder symbols it can produce; this allows skipping the retrieval of its symbols.
+        """
+        if dependency.type == "dll":
+            # the only placeholder symbol of a DLL is named after the DLL itself
+            return dependency.name.casefold() == folded_name
+        if dependency.type == "nuget":
+            return folded_name in _COMMON_TYPE_NAMES
+        return True
+
+    def _needs_discovery(self) -> bool:
+        return not self._dependencies_discovered and not self._dependencies_info
+
     def _discover_dependencies(self) -> None:
         """Discover all project dependencies."""
         self._dependencies_info = []
+        self._dependencies_discovered = True
         
         # Discover NuGet packages
         self._discover_nuget_dependencies()
@@ -130,64 +712,160 @@ class DependencySymbolRetriever:
         """Discover NuGet package dependencies from project files."""
         project_root = self.project.project_root
         
-        # Look for .csproj files
-        csproj_files = []
-        for root, _, files in os.walk(project_root):
-            for file in files:
-                if file.endswith('.csproj'):
-                    csproj_files.append(os.path.join(root, file))
-                    
-        for csproj_file in csproj_files:
+        # the same package is typically referenced by many projects of a solution
+        seen_packages: set[tuple[str, str]] = set()
+        packages: list[DependencyInfo] = []
+        project_tfms: set[str] = set()
+
+        for entry in _scan_files(project_root, ".csproj"):
             try:
-                tree = ET.parse(csproj_file)
-                root = tree.getroot()
-                
-                # Find PackageReference elements
-                for package_ref in root.findall(".//PackageReference"):
-                    name = package_ref.get('Include')
-                    version = package_ref.get('Version')
-                    
+                package_references, target_frameworks = self._get_project_file_info(entry)
+            except OSError as e:
+                log.warning(f"Cannot read project file {entry.path}: {e}")
+                continue
+            project_tfms.update(target_frameworks)
+            for name, version in package_references:
+                if (name, version) not in seen_packages:
+                    seen_packages.add((name, version))
+                    packages.append(DependencyInfo(name=name, version=version, type="nuget", assembly_name=f"{name}.dll"))
+
+        # Resolve the packages' assemblies in the global packages folder, such that they can be decompiled
+        nuget_root = _nuget_packages_root()
+        if packages and nuget_root.is_dir():
+            for i, dependency in enumerate(packages):
+                assembly_path = _find_nuget_assembly(nuget_root, dependency.name, dependency.version, frozenset(project_tfms))
+                if assembly_path is None:
+                    continue
+                try:
+                    stat = os.stat(assembly_path)
+                except OSError as e:
+                    log.warning(f"Cannot read assembly {assembly_path} of NuGet package {dependency.name}: {e}")
+                    continue
+                packages[i] = replace(dependency, path=assembly_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self._dependencies_info.extend(packages)
+
+    def _get_project_file_info(self, entry: os.DirEntry) -> tuple[list[tuple[str, str]], list[str]]:
+        """
+        Get the package references and (lower-case) target frameworks of a project file,
+        re-parsing the file only if it was modified since it was last parsed.
+        """
+        mtime_ns = entry.stat().st_mtime_ns
+        cached = self._project_file_cache.get(entry.path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        package_references: list[tuple[str, str]] = []
+        target_frameworks: list[str] = []
+        try:
+            # Stream-parse the project file, such that the full element tree is never held in memory:
+            # each top-level element (ItemGroup, PropertyGroup, Choose, ...) is detached from the root once it was processed,
+            # so memory use is bounded by the largest top-level element rather than by the file.
+            # Tags are compared without their namespace, so that both SDK-style and legacy (xmlns-qualified)
+            # project files are supported.
+            root: Optional[ET.Element] = None
+            depth = 0
+            for event, elem in ET.iterparse(entry.path, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+                depth -= 1
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if tag == "PackageReference":
+                    name = elem.get("Include")
+                    # the version may also be given as a child element (<Version>1.2.3</Version>)
+                    version = elem.get("Version") or (elem.findtext("{*}Version") or "").strip()
                     if name and version:
-                        self._dependencies_info.append(
-                            DependencyInfo(
-                                name=name,
-                                version=version,
-                                type="nuget",
-                                assembly_name=f"{name}.dll"
-                            )
-                        )
-                        
-            except ET.ParseError as e:
-                log.warning(f"Failed to parse project file {csproj_file}: {e}")
-                
+                        package_references.append((name, version))
+                elif tag in ("TargetFramework", "TargetFrameworks") and elem.text:
+                    target_frameworks.extend(tfm.strip().lower() for tfm in elem.text.split(";") if tfm.strip())
+                if depth == 1 and root is not None:
+                    root.clear()
+        except ET.ParseError as e:
+            log.warning(f"Failed to parse project file {entry.path}: {e}")
+
+        self._project_file_cache[entry.path] = (mtime_ns, package_references, target_frameworks)
+        return package_references, target_frameworks
+
     def _discover_external_dlls(self) -> None:
         """Discover external DLL dependencies from configured search paths."""
-        search_paths = [self.project.project_root] + self.config.external_search_paths
-        
+        search_paths = self._get_dll_search_roots()
+        # identical DLLs (e.g. copies of the same assembly in the bin directories of several projects) are processed once;
+        # this includes copies of the assemblies of NuGet packages which were resolved in the global packages folder
+        seen_dlls: set[tuple[str, int, bytes]] = set()
+        for dependency in self._dependencies_info:
+            if dependency.type == "nuget" and dependency.path is not None:
+                assembly_name = os.path.basename(dependency.path)[: -len(".dll")]
+                try:
+                    seen_dlls.add(self._get_dll_identity(dependency.path, assembly_name, dependency.size))
+                except OSError as e:
+                    log.debug(f"Cannot read assembly {dependency.path} of NuGet package {dependency.name}: {e}")
+
+        # Optionally skip system assemblies (filtered during the scan)
+        exclude_prefixes = () if self.config.include_system_assemblies else _SYSTEM_ASSEMBLY_PREFIXES
+
+        # search paths which do not exist (or are not directories) are skipped by the scan itself, without a separate check
         for path in search_paths:
-            if not os.path.isdir(path):
-                continue
-            for root, _, files in os.walk(path):
-                for file in files:
-                    if file.endswith('.dll'):
-                        # Optionally skip system assemblies
-                        if not self.config.include_system_assemblies and file.startswith('System.'):
-                            continue
-
-                        dll_path = os.path.join(root, file)
-                        assembly_name = os.path.splitext(file)[0]
-                        
-                        self._dependencies_info.append(
-                            DependencyInfo(
-                                name=assembly_name,
-                                version="unknown",
-                                type="dll",
-                                path=dll_path,
-                                assembly_name=assembly_name
-                            )
-                        )
-                
-    def _get_dependency_symbols(self, dependency: DependencyInfo, include_body: bool = False) -> List[LanguageServerSymbol]:
+            for entry in _scan_files(path, ".dll", skip_dirs=_DLL_SKIP_DIRS, exclude_prefixes=exclude_prefixes):
+                assembly_name = entry.name[: -len(".dll")]
+                try:
+                    stat = entry.stat()
+                    identity = self._get_dll_identity(entry.path, assembly_name, stat.st_size)
+                except OSError as e:
+                    log.warning(f"Cannot read DLL {entry.path}: {e}")
+                    continue
+                if identity in seen_dlls:
+                    continue
+                seen_dlls.add(identity)
+
+                self._dependencies_info.append(
+                    DependencyInfo(
+                        name=assembly_name,
+                        version="unknown",
+                        type="dll",
+                        path=entry.path,
+                        assembly_name=assembly_name,
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                    )
+                )
+
+    def _get_dll_search_roots(self) -> list[str]:
+        """
+        Get the (real) paths of the directories to scan for DLLs, i.e. the project root and the external search paths
+        (relative ones being resolved against the project root), omitting duplicates and directories which are
+        already covered by the scan of another root.
+        """
+        project_root = self.project.project_root
+        roots: list[str] = []
+        for path in (project_root, *self.config.external_search_paths):
+            real_path = os.path.realpath(os.path.join(project_root, path))
+            if real_path not in roots:
+                roots.append(real_path)
+
+        def is_covered(root: str, other_root: str) -> bool:
+            # the scan of other_root reaches root unless a directory in between is skipped
+            try:
+                if root == other_root or os.path.commonpath([root, other_root]) != other_root:
+                    return False
+            except ValueError:  # paths on different drives
+                return False
+            return not any(part in _DLL_SKIP_DIRS for part in os.path.relpath(root, other_root).split(os.sep))
+
+        return [root for root in roots if not any(is_covered(root, other_root) for other_root in roots)]
+
+    @staticmethod
+    def _get_dll_identity(path: str, assembly_name: str, size: int) -> tuple[str, int, bytes]:
+        """
+        Computes a key identifying the content of a DLL, which is based on its name, size and leading bytes
+        (containing the PE and CLI headers) rather than on its full content.
+        """
+        with open(path, "rb") as f:
+            header_digest = hashlib.blake2b(f.read(4096), digest_size=16).digest()
+        return assembly_name, size, header_digest
+
+    def _get_dependency_symbols(self, dependency: DependencyInfo, include_body: bool = False) -> list[LanguageServerSymbol]:
         """
         Get symbols from a specific dependency.
         
@@ -195,22 +873,60 @@ class DependencySymbolRetriever:
         :param include_body: Whether to include symbol bodies
         :return: List of symbols from the dependency
         """
-        cache_key = f"{dependency.type}:{dependency.name}:{dependency.version}:{include_body}"
-        
-        if cache_key in self._dependency_cache:
-            return self._dependency_cache[cache_key]
+        cache_key = self._get_cache_key(dependency, include_body)
+        with self._cache_lock:
+            cached_symbols = self._dependency_cache.get(cache_key)
+            if cached_symbols is not None:
+                self._dependency_cache.move_to_end(cache_key)
+                return cached_symbols
             
-        symbols: List[LanguageServerSymbol] = []
+        symbols: list[LanguageServerSymbol] = []
         
         if dependency.type == "nuget":
             symbols = self._get_nuget_symbols(dependency, include_body)
         elif dependency.type == "dll" and dependency.path:
             symbols = self._get_dll_symbols(dependency, include_body)
             
-        self._dependency_cache[cache_key] = symbols
+        with self._cache_lock:
+            self._dependency_cache[cache_key] = symbols
+            self._dependency_cache.move_to_end(cache_key)
+            while len(self._dependency_cache) > self.config.cache_max_entries:
+                evicted_key, _ = self._dependency_cache.popitem(last=False)
+                self._name_index_cache.pop(evicted_key, None)
         return symbols
         
-    def _get_nuget_symbols(self, dependency: DependencyInfo, include_body: bool) -> List[LanguageServerSymbol]:
+    @property
+    def _max_workers(self) -> int:
+        """The maximum number of dependencies processed concurrently"""
+        return self.config.scan_workers or _MAX_WORKERS
+
+    def _is_cached(self, dependency: DependencyInfo, include_body: bool) -> bool:
+        """Whether the symbols of the given dependency are in the symbol cache."""
+        with self._cache_lock:
+            return self._get_cache_key(dependency, include_body) in self._dependency_cache
+
+    @staticmethod
+    def _get_cache_key(dependency: DependencyInfo, include_body: bool) -> _CacheKey:
+        # the file's path, size and modification time are part of the key, such that entries for changed DLLs are not reused
+        return dependency.type, dependency.name, dependency.version, dependency.path, dependency.size, dependency.mtime_ns, include_body
+
+    def _get_dependency_name_index(self, dependency: DependencyInfo, include_body: bool) -> dict[str, list[LanguageServerSymbol]]:
+        """Get the symbols of a specific dependency grouped by case-folded name."""
+        cache_key = self._get_cache_key(dependency, include_body)
+        with self._cache_lock:
+            name_index = self._name_index_cache.get(cache_key)
+        if name_index is None:
+            symbols_by_name: dict[str, list[LanguageServerSymbol]] = defaultdict(list)
+            for symbol in self._get_dependency_symbols(dependency, include_body):
+                symbols_by_name[(symbol.name or "").casefold()].append(symbol)
+            name_index = dict(symbols_by_name)
+            with self._cache_lock:
+                # the index is only retained as long as the symbols it was built from
+                if cache_key in self._dependency_cache:
+                    self._name_index_cache[cache_key] = name_index
+        return name_index
+
+    def _get_nuget_symbols(self, dependency: DependencyInfo, include_body: bool) -> list[LanguageServerSymbol]:
         """Get symbols from a NuGet package."""
         # This is a placeholder - actual implementation would use package metadata
         # or decompilation if the package is available locally
@@ -219,136 +935,219 @@ class DependencySymbolRetriever:
         common_symbols = self._create_common_dotnet_symbols(dependency)
         return common_symbols
         
-    def _get_dll_symbols(self, dependency: DependencyInfo, include_body: bool) -> List[LanguageServerSymbol]:
+    def _get_dll_symbols(self, dependency: DependencyInfo, include_body: bool) -> list[LanguageServerSymbol]:
         """Get symbols from an external DLL using the configured decompiler."""
-        if not dependency.path or not os.path.exists(dependency.path) or not self._decompiler:
+        # the backend setting is checked rather than the backend itself, which is not created if decompilation is disabled
+        if not dependency.exists() or self.config.decompiler_backend not in _DECOMPILER_BACKENDS:
             return []
 
         if not self.config.decompilation_enabled:
             return self._create_placeholder_dll_symbols(dependency)
 
-        # Use the decompiler to get the symbols
-        type_names = self._decompiler.enumerate_types(dependency.path)
-        symbols = []
-        for type_name in type_names:
-            body = self._decompiler.decompile_type_body(dependency.path, type_name) if include_body else ""
-            # This part needs to be improved to create a proper symbol from the decompiled code
-            # For now, we'll just create a placeholder
-            symbols.append(self._create_placeholder_dll_symbols(dependency)[0])
-        return symbols
-        
-    def _get_decompiler(self) -> Optional[DecompilerBackend]:
+        return [self._materialize_symbol(dependency, type_name, kind, include_body) for type_name, kind in self._list_types(dependency)]
+
+    def _is_decompilable(self, dependency: DependencyInfo) -> bool:
+        """Whether the symbols of the given dependency are obtained from the decompiler."""
+        return (
+            dependency.type in ("dll", "nuget")
+            and self.config.decompilation_enabled
+            and self._decompiler is not None
+            and dependency.exists()
+        )
+
+    def _list_types(self, dependency: DependencyInfo) -> list[tuple[str, SymbolKind]]:
+        """
+        Enumerate the types of a DLL dependency without decompiling them.
+        Results are cached in memory and, if enabled, on disk (keyed by the DLL's size, modification time and header).
+        """
+        assert dependency.path is not None and self._decompiler is not None
+        types, disk_key = self._get_cached_types(dependency)
+        if types is None:
+            types = self._store_types(dependency, self._decompiler.enumerate_types_with_kinds(dependency.path), disk_key)
+        return types
+
+    async def _list_types_async(self, dependency: DependencyInfo) -> list[tuple[str, SymbolKind]]:
+        """Asynchronous variant of _list_types, which uses the decompiler's asynchronous type enumeration."""
+        assert dependency.path is not None and self._decompiler is not None
+        types, disk_key = await asyncio.to_thread(self._get_cached_types, dependency)
+        if types is None:
+            raw_types = await self._decompiler.enumerate_types_with_kinds_async(dependency.path)
+            types = await asyncio.to_thread(self._store_types, dependency, raw_types, disk_key)
+        return types
+
+    def _get_cached_types(self, dependency: DependencyInfo) -> tuple[Optional[list[tuple[str, SymbolKind]]], Optional[str]]:
+        """
+        Looks up the types of a DLL dependency in the memory and disk caches.
+
+        :return: a pair (types, disk_key), where types is None if the types are not cached and disk_key is
+            the key under which they are to be stored in the disk cache (None if the disk cache is disabled
+            or the DLL cannot be read, e.g. because it was deleted after discovery)
+        """
+        assert dependency.path is not None
+        types = self._types_cache.get(dependency.path)
+        if types is not None:
+            return types, None
+
+        disk_cache = self._disk_cache
+        disk_key = None
+        if disk_cache is not None:
+            size, mtime_ns = dependency.size, dependency.mtime_ns
+            try:
+                if size == 0:
+                    stat = os.stat(dependency.path)
+                    size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                disk_key = _DiskCache.file_key(dependency.path, size, mtime_ns, *self._type_listing_discriminators())
+            except OSError as e:
+                log.warning(f"Cannot read DLL {dependency.path}, bypassing the dependency cache: {e}")
+                return None, None
+            cached = disk_cache.get(disk_key)
+            if cached is not None:
+                types = [(type_name, SymbolKind(kind)) for type_name, kind in cached]
+                self._types_cache[dependency.path] = types
+        return types, disk_key
+
+    def _type_listing_discriminators(self) -> tuple[str, ...]:
+        """The configuration settings which affect the types reported by the decompiler backend (part of the disk cache key)"""
+        config = self.config
+        return config.decompiler_backend, config.ilspycmd_path, f"include_private_members={config.include_private_members}"
+
+    def _store_types(
+        self, dependency: DependencyInfo, raw_types: list[tuple[str, Optional[str]]], disk_key: Optional[str]
+    ) -> list[tuple[str, SymbolKind]]:
+        """Converts the types reported by the decompiler to symbol kinds and stores them in the caches."""
+        assert dependency.path is not None
+        types = [
+            (type_name, _KIND_TO_SYMBOL_KIND.get(kind, SymbolKind.Class) if kind else SymbolKind.Class) for type_name, kind in raw_types
+        ]
+        if self._disk_cache is not None and disk_key is not None and types:
+            self._disk_cache.put(disk_key, [[type_name, int(kind)] for type_name, kind in types])
+        self._types_cache[dependency.path] = types
+        return types
+
+    def _materialize_symbol(self, dependency: DependencyInfo, type_name: str, kind: SymbolKind, include_body: bool) -> LanguageServerSymbol:
+        """Create the symbol for a type of a DLL dependency, decompiling its body if requested."""
+        assert dependency.path is not None and self._decompiler is not None
+        namespace, _, name = type_name.rpartition(".")
+        body = self._decompiler.decompile_type_body(dependency.path, type_name) if include_body else None
+        return self._make_symbol(name, kind, dependency, container_name=namespace or None, body=body)
+
+    def _make_symbol(
+        self,
+        name: str,
+        kind: SymbolKind,
+        dependency: DependencyInfo,
+        container_name: Optional[str] = None,
+        body: Optional[str] = None,
+    ) -> LanguageServerSymbol:
+        """
+        Create a symbol of the given dependency from the dependency's symbol template.
+
+        :param name: the symbol's (simple) name
+        :param kind: the symbol's kind
+        :param dependency: the dependency containing the symbol
+        :param container_name: the name of the containing namespace, if any
+        :param body: the symbol's source code, if any
+        """
+        symbol_info = self._get_symbol_template(dependency).copy()
+        symbol_info["name"] = name
+        symbol_info["kind"] = kind
+        symbol_info["children"] = []
+        if container_name is not None:
+            symbol_info["containerName"] = container_name
+        if body is not None:
+            symbol_info["body"] = body
+        return LanguageServerSymbol(symbol_info)
+
+    def _get_symbol_template(self, dependency: DependencyInfo) -> UnifiedSymbolInformation:
+        """
+        Get the template for the symbols of the given dependency, which holds the (shared, read-only) location.
+        Symbols are created by shallow-copying the template and setting the name, kind and children.
+        """
+        template = self._symbol_templates.get(dependency.name)
+        if template is None:
+            external_path = f"external:{dependency.name}"
+            uri = PathUtils.path_to_uri(external_path)
+            template = {
+                "name": "",
+                "kind": SymbolKind.Class,
+                "location": Location(uri=uri, range=_ZERO_RANGE, absolutePath=external_path, relativePath=external_path),
+                "selectionRange": _ZERO_RANGE,
+                "children": [],
+            }
+            self._symbol_templates[dependency.name] = template
+        return template
+
+    @cached_property
+    def _decompiler(self) -> Optional["DecompilerBackend"]:
+        """The configured decompiler backend, which is created (and its module imported) on first use"""
+        return self._get_decompiler()
+
+    def _get_decompiler(self) -> Optional["DecompilerBackend"]:
         """Returns an instance of the configured decompiler backend."""
+        from serena.dependency_decompiler import CecilDecompiler, IlSpyDecompiler
+
         backend_name = self.config.decompiler_backend
+        ilspycmd_path = self.config.ilspycmd_path
+        depth = self.config.decompilation_depth
+        include_private_members = self.config.include_private_members
         if backend_name == "ilspy":
-            return IlSpyDecompiler(ilspycmd_path=self.config.ilspycmd_path, depth=self.config.decompilation_depth, include_private_members=self.config.include_private_members)
+            return IlSpyDecompiler(ilspycmd_path=ilspycmd_path, depth=depth, include_private_members=include_private_members)
         elif backend_name == "cecil":
-            return CecilDecompiler(depth=self.config.decompilation_depth, include_private_members=self.config.include_private_members)
+            return CecilDecompiler(depth=depth, include_private_members=include_private_members)
         elif backend_name == "auto":
             # Prefer ILSpy if available, otherwise fall back to Cecil.
             try:
-                return IlSpyDecompiler(ilspycmd_path=self.config.ilspycmd_path, depth=self.config.decompilation_depth, include_private_members=self.config.include_private_members)
+                return IlSpyDecompiler(ilspycmd_path=ilspycmd_path, depth=depth, include_private_members=include_private_members)
             except ImportError:
-                return CecilDecompiler(depth=self.config.decompilation_depth, include_private_members=self.config.include_private_members)
+                return CecilDecompiler(depth=depth, include_private_members=include_private_members)
         return None
 
-    def _create_common_dotnet_symbols(self, dependency: DependencyInfo) -> List[LanguageServerSymbol]:
+    def _create_common_dotnet_symbols(self, dependency: DependencyInfo) -> list[LanguageServerSymbol]:
         """Create placeholder symbols for common .NET types and methods."""
-        symbols = []
-        
-        # Add common System types
-        common_types = [
-            ("System", "Console", SymbolKind.Class),
-            ("System", "String", SymbolKind.Class),
-            ("System", "Int32", SymbolKind.Class),
-            ("System.Collections", "List", SymbolKind.Class),
-            ("System.Collections.Generic", "Dictionary", SymbolKind.Class),
+        dependency_name = dependency.name.lower()
+        return [
+            self._make_symbol(type_name, kind, dependency)
+            for namespace, type_name, kind, namespace_lower, type_name_lower in _COMMON_TYPES
+            if dependency_name in namespace_lower or dependency_name in type_name_lower
         ]
         
-        for namespace, type_name, kind in common_types:
-            if dependency.name.lower() in namespace.lower() or dependency.name.lower() in type_name.lower():
-                # Create proper UnifiedSymbolInformation structure
-                from solidlsp.ls_types import UnifiedSymbolInformation, Location, Range, Position
-                from solidlsp.ls_utils import PathUtils
-                
-                # Create a file URI for the external dependency
-                external_path = f"external:{dependency.name}"
-                uri = PathUtils.path_to_uri(external_path)
-                
-                symbol_info: UnifiedSymbolInformation = {
-                    "name": type_name,
-                    "kind": kind,
-                    "location": Location(
-                        uri=uri,
-                        range=Range(
-                            start=Position(line=0, character=0),
-                            end=Position(line=0, character=0)
-                        ),
-                        absolutePath=external_path,
-                        relativePath=external_path
-                    ),
-                    "selectionRange": Range(
-                        start=Position(line=0, character=0),
-                        end=Position(line=0, character=0)
-                    ),
-                    "children": []
-                }
-                symbols.append(LanguageServerSymbol(symbol_info))
-                
-        return symbols
-        
-    def _create_placeholder_dll_symbols(self, dependency: DependencyInfo) -> List[LanguageServerSymbol]:
+    def _create_placeholder_dll_symbols(self, dependency: DependencyInfo) -> list[LanguageServerSymbol]:
         """Create placeholder symbols for DLL dependencies."""
-        symbols = []
-        
         # Create a placeholder class symbol for the DLL
-        from solidlsp.ls_types import UnifiedSymbolInformation, Location, Range, Position
-        from solidlsp.ls_utils import PathUtils
-        
-        # Create a file URI for the external dependency
-        external_path = f"external:{dependency.name}"
-        uri = PathUtils.path_to_uri(external_path)
-        
-        symbol_info: UnifiedSymbolInformation = {
-            "name": dependency.name,
-            "kind": SymbolKind.Class,
-            "location": Location(
-                uri=uri,
-                range=Range(
-                    start=Position(line=0, character=0),
-                    end=Position(line=0, character=0)
-                ),
-                absolutePath=external_path,
-                relativePath=external_path
-            ),
-            "selectionRange": Range(
-                start=Position(line=0, character=0),
-                end=Position(line=0, character=0)
-            ),
-            "children": []
-        }
-        symbols.append(LanguageServerSymbol(symbol_info))
-        
-        return symbols
+        return [self._make_symbol(dependency.name, SymbolKind.Class, dependency)]
         
-    def _matches_search_criteria(
-        self,
-        symbol: LanguageServerSymbol,
+    @staticmethod
+    def _make_matcher(
         name_path: str,
-        include_kinds: Optional[Sequence[SymbolKind]],
-        exclude_kinds: Optional[Sequence[SymbolKind]],
-        substring_matching: bool
-    ) -> bool:
-        """Check if a symbol matches the search criteria."""
-        # Check symbol kind
-        if include_kinds and symbol.symbol_kind not in include_kinds:
-            return False
-        if exclude_kinds and symbol.symbol_kind in exclude_kinds:
-            return False
-            
-        # Check name matching
-        symbol_name = symbol.name or ""
+        include_kinds: Optional[Collection[SymbolKind]],
+        exclude_kinds: Optional[Collection[SymbolKind]],
+        substring_matching: bool,
+    ) -> SymbolMatcher:
+        """
+        Create a predicate checking whether a symbol's name and kind match the search criteria.
+        The predicate expects case-folded names, which callers compute once per symbol (and the symbol index once per type);
+        the name pattern and kind sets are prepared once per query instead of once per symbol.
+        """
+        # (frozenset() returns frozensets passed by the caller as they are, without copying)
+        include_set = frozenset(include_kinds) if include_kinds else None
+        exclude_set = frozenset(exclude_kinds) if exclude_kinds else None
+        needle = name_path.casefold()
+
         if substring_matching:
-            return name_path.lower() in symbol_name.lower()
+
+            def matches_name(name: str) -> bool:
+                return needle in name
+
         else:
-            return symbol_name.lower() == name_path.lower()
\ No newline at end of file
+
+            def matches_name(name: str) -> bool:
+                return name == needle
+
+        def matcher(name: str, kind: SymbolKind) -> bool:
+            if include_set is not None and kind not in include_set:
+                return False
+            if exclude_set is not None and kind in exclude_set:
+                return False
+            return matches_name(name)
+
+        return matcher
@@ -16,7 +16,6 @@ from .project import Project
 
 if TYPE_CHECKING:
     from .agent import SerenaAgent
-    from .dependency_symbol import DependencySymbolRetriever
 
 log = logging.getLogger(__name__)
 
@@ -450,7 +449,6 @@ class LanguageServerSymbolRetriever:
         """
         self._lang_server = lang_server
         self.agent = agent
-        self._dependency_retriever: Optional["DependencySymbolRetriever"] = None
 
     def set_language_server(self, lang_server: SolidLanguageServer) -> None:
         """
@@ -549,14 +547,12 @@ class LanguageServerSymbolRetriever:
         include_external_dlls: bool = True,
     ) -> list[LanguageServerSymbol]:
         """Get symbols from project dependencies."""
-        if self.agent is None:
+        # the agent's retriever is shared, such that its caches are retained across symbol retrievers
+        dependency_retriever = self.agent.dependency_symbol_retriever if self.agent is not None else None
+        if dependency_retriever is None:
             return []
-            
-        if self._dependency_retriever is None:
-            from serena.dependency_symbol import DependencySymbolRetriever
-            self._dependency_retriever = DependencySymbolRetriever(self.agent.get_active_project_or_raise())
-            
-        return self._dependency_retriever.find_dependency_symbols(
+
+        return dependency_retriever.find_dependency_symbols(
             name_path,
             include_body=include_body,
             include_kinds=include_kinds,
@@ -4,7 +4,6 @@ Dependency symbol search tools for external libraries and NuGet packages.
 
 import json
 import logging
-import os
 from typing import Any
 
 from serena.tools import (
@@ -21,6 +20,14 @@ from .symbol_tools import _sanitize_symbol_dict
 log = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """
+    Serializes the given object to compact JSON: results (especially ones including decompiled bodies) can be large,
+    and the default separators and ASCII escaping inflate them, causing max_answer_chars to be exceeded sooner.
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 class FindDependencySymbolTool(Tool, ToolMarkerSymbolicRead):
     """
     Performs a global search for symbols in project dependencies (NuGet packages and external DLLs).
@@ -52,13 +59,10 @@ class FindDependencySymbolTool(Tool, ToolMarkerSymbolicRead):
         :param max_answer_chars: Max characters for the JSON result. If exceeded, no content is returned.
         :return: a list of dependency symbols (with locations and metadata) matching the name.
         """
-        parsed_include_kinds: list[SymbolKind] | None = [SymbolKind(k) for k in include_kinds] if include_kinds else None
-        parsed_exclude_kinds: list[SymbolKind] | None = [SymbolKind(k) for k in exclude_kinds] if exclude_kinds else None
-        
-        # Get dependency symbol retriever
-        dependency_retriever = self.create_dependency_symbol_retriever()
+        parsed_include_kinds: frozenset[SymbolKind] | None = frozenset(SymbolKind(k) for k in include_kinds) if include_kinds else None
+        parsed_exclude_kinds: frozenset[SymbolKind] | None = frozenset(SymbolKind(k) for k in exclude_kinds) if exclude_kinds else None
         
-        symbols = dependency_retriever.find_dependency_symbols(
+        symbols = self.dependency_symbol_retriever.find_dependency_symbols(
             name_path,
             include_body=include_body,
             include_kinds=parsed_include_kinds,
@@ -68,8 +72,18 @@ class FindDependencySymbolTool(Tool, ToolMarkerSymbolicRead):
             include_external_dlls=include_external_dlls,
         )
         
+        # The bodies' lengths are a lower bound for the length of the serialized result, so results which would
+        # be rejected anyway for being too long are rejected without serializing (potentially large) decompiled bodies.
+        if include_body:
+            min_chars = sum(len(s.body or "") for s in symbols)
+            if min_chars > max_answer_chars:
+                return (
+                    f"The answer is too long (more than {min_chars} characters). "
+                    + "Please try a more specific tool query or raise the max_answer_chars parameter."
+                )
+
         symbol_dicts = [_sanitize_symbol_dict(s.to_dict(kind=True, location=True, depth=0, include_body=include_body)) for s in symbols]
-        result = json.dumps(symbol_dicts)
+        result = _dumps(symbol_dicts)
         return self._limit_length(result, max_answer_chars)
 
 
@@ -88,10 +102,9 @@ class ListDependenciesTool(Tool, ToolMarkerSymbolicRead):
         :param max_answer_chars: Max characters for the JSON result. If exceeded, no content is returned.
         :return: a list of dependency information including name, version, and type.
         """
-        dependency_retriever = self.create_dependency_symbol_retriever()
-        dependencies = dependency_retriever.list_dependencies()
+        dependencies = self.dependency_symbol_retriever.list_dependencies()
         
-        result = json.dumps(dependencies)
+        result = _dumps(dependencies)
         return self._limit_length(result, max_answer_chars)
 
 
@@ -105,6 +118,5 @@ class ClearDependencyCacheTool(Tool, ToolMarkerOptional):
         Clears the cached dependency symbols. Use this if dependencies have changed
         or if you want to force a fresh scan of all dependencies.
         """
-        dependency_retriever = self.create_dependency_symbol_retriever()
-        dependency_retriever.clear_cache()
+        self.dependency_symbol_retriever.clear_cache()
         return SUCCESS_RESULT
\ No newline at end of file
@@ -53,11 +53,14 @@ class Component(ABC):
         assert language_server is not None
         return LanguageServerSymbolRetriever(language_server, agent=self.agent)
 
-    def create_dependency_symbol_retriever(self) -> DependencySymbolRetriever:
+    @property
+    def dependency_symbol_retriever(self) -> DependencySymbolRetriever:
         """
-        Create a dependency symbol retriever for searching symbols in external dependencies.
+        The active project's retriever for searching symbols in external dependencies, which is shared
+        by all tool calls (such that its caches are retained between them).
         """
-        return DependencySymbolRetriever(self.project)
+        assert self.agent.dependency_symbol_retriever is not None
+        return self.agent.dependency_symbol_retriever
 
     @property
     def project(self) -> Project:
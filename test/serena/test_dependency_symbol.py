@@ -2,14 +2,24 @@
 Tests for dependency symbol search functionality.
 """
 
+import asyncio
+import json
 import os
+import shutil
+import struct
+import subprocess
 import tempfile
+import threading
 import unittest
-from unittest.mock import Mock, patch
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
-from serena.dependency_symbol import DependencySymbolRetriever, DependencyInfo
+from serena.dependency_decompiler import CecilDecompiler, IlSpyDecompiler, read_type_definitions
+from serena.dependency_symbol import DependencySymbolRetriever, DependencyInfo, _DiskCache, _find_nuget_assembly, _SymbolIndex
 from serena.config.dependency_config import DependencySymbolConfig
 from serena.project import Project
+from serena.tools.dependency_symbol_tools import ClearDependencyCacheTool, FindDependencySymbolTool
 from serena.config.serena_config import ProjectConfig
 from solidlsp.ls_config import Language
 from solidlsp.ls_types import SymbolKind
@@ -35,7 +45,8 @@ class TestDependencySymbolRetriever(unittest.TestCase):
             decompilation_enabled=True,
             include_nuget_packages=True,
             include_external_dlls=True,
-            external_search_paths=[os.path.join(self.temp_dir, "external_libs")]
+            external_search_paths=[os.path.join(self.temp_dir, "external_libs")],
+            disk_cache_dir=os.path.join(self.temp_dir, "dependency_cache"),
         )
         
         self.retriever = DependencySymbolRetriever(self.project, self.config)
@@ -49,7 +60,6 @@ class TestDependencySymbolRetriever(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def test_initialization(self):
@@ -66,6 +76,63 @@ class TestDependencySymbolRetriever(unittest.TestCase):
         self.retriever.clear_cache()
         self.assertEqual(len(self.retriever._dependency_cache), 0)
 
+    def test_dependency_cache_evicts_least_recently_used_entries(self):
+        """Test that the symbol cache is bounded and supports purging the entries of a single dependency."""
+        config = DependencySymbolConfig(cache_max_entries=2, disk_cache_dir=self.config.disk_cache_dir)
+        retriever = DependencySymbolRetriever(self.project, config)
+        deps = [DependencyInfo(name=name, version="1.0", type="nuget") for name in ("System", "Collections", "Generic")]
+
+        retriever._get_dependency_symbols(deps[0])
+        retriever._get_dependency_symbols(deps[1])
+        retriever._get_dependency_symbols(deps[0])
+        retriever._get_dependency_symbols(deps[2])
+        self.assertEqual([key[1] for key in retriever._dependency_cache], ["System", "Generic"])
+
+        retriever.purge("System")
+        self.assertEqual([key[1] for key in retriever._dependency_cache], ["Generic"])
+
+    @patch("subprocess.run")
+    def test_purge_discards_decompiled_bodies(self, mock_subprocess_run):
+        """Test that the type bodies of a purged dependency are decompiled anew."""
+        mock_subprocess_run.side_effect = TestIlSpyDecompiler._write_project_output
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+        decompiler.enumerate_types_with_kinds = Mock(return_value=[("Game.Net.NetPackageManager", "Class")])
+        self.retriever._decompiler = decompiler
+        dependency = DependencyInfo(
+            name="NetPackageManager", version="unknown", type="dll", path=os.path.join(self.external_lib_path, "NetPackageManager.dll")
+        )
+        self.retriever._dependencies_info = [dependency]
+
+        symbols = self.retriever._get_dependency_symbols(dependency, include_body=True)
+        self.assertEqual(symbols[0].body, "public class NetPackageManager {}")
+        self.retriever.purge("NetPackageManager")
+        self.retriever._get_dependency_symbols(dependency, include_body=True)
+        self.assertEqual(mock_subprocess_run.call_count, 2)
+
+    def test_decompiler_is_not_created_if_decompilation_is_disabled(self):
+        """Test that searches with decompilation disabled return placeholder symbols without creating the decompiler backend."""
+        config = DependencySymbolConfig(
+            decompilation_enabled=False,
+            external_search_paths=self.config.external_search_paths,
+            disk_cache_dir=self.config.disk_cache_dir,
+        )
+        retriever = DependencySymbolRetriever(self.project, config)
+
+        symbols = retriever.find_dependency_symbols("package", substring_matching=True)
+        self.assertIn("NetPackageManager", [s.name for s in symbols])
+        self.assertNotIn("_decompiler", retriever.__dict__)
+
+    def test_project_without_dependencies_is_scanned_once(self):
+        """Test that an empty discovery result is retained until the cache is cleared."""
+        os.remove(os.path.join(self.external_lib_path, "NetPackageManager.dll"))
+        with patch.object(self.retriever, "_discover_external_dlls", wraps=self.retriever._discover_external_dlls) as mock_discover:
+            self.assertEqual(self.retriever.list_dependencies(), [])
+            self.assertEqual(self.retriever.find_dependency_symbols("Console"), [])
+            self.assertEqual(mock_discover.call_count, 1)
+            self.retriever.clear_cache()
+            self.retriever.list_dependencies()
+            self.assertEqual(mock_discover.call_count, 2)
+
     @patch('serena.dependency_symbol.DependencySymbolRetriever._discover_nuget_dependencies')
     def test_discover_external_dlls(self, mock_discover_nuget):
         """Test discovery of external DLLs."""
@@ -75,20 +142,261 @@ class TestDependencySymbolRetriever(unittest.TestCase):
         self.assertEqual(len(dll_deps), 1)
         self.assertEqual(dll_deps[0].name, "NetPackageManager")
         
-    @patch('subprocess.run')
-    def test_find_dependency_symbols_with_decompiler(self, mock_subprocess_run):
+    def test_dll_search_roots_are_deduplicated(self):
+        """Test that search paths covered by the scan of another search path are not scanned again."""
+        outside_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, outside_dir)
+        config = DependencySymbolConfig(
+            external_search_paths=["external_libs", self.external_lib_path, os.path.join("obj", "libs"), outside_dir, outside_dir],
+            disk_cache_dir=self.config.disk_cache_dir,
+        )
+        retriever = DependencySymbolRetriever(self.project, config)
+
+        roots = retriever._get_dll_search_roots()
+        project_root = os.path.realpath(self.temp_dir)
+        self.assertEqual(roots, [project_root, os.path.join(project_root, "obj", "libs"), os.path.realpath(outside_dir)])
+
+    def test_discover_nuget_dependencies(self):
+        """Test discovery of NuGet package references in SDK-style and legacy project files."""
+        for project_name in ("Sdk", "OtherSdk"):
+            with open(os.path.join(self.temp_dir, f"{project_name}.csproj"), "w") as f:
+                f.write(
+                    '<Project Sdk="Microsoft.NET.Sdk"><ItemGroup>'
+                    '<PackageReference Include="Newtonsoft.Json" Version="13.0.3" />'
+                    "</ItemGroup></Project>"
+                )
+        with open(os.path.join(self.temp_dir, "Legacy.csproj"), "w") as f:
+            f.write(
+                '<Project xmlns="http://schemas.microsoft.com/developer/msbuild/2003"><ItemGroup>'
+                '<PackageReference Include="Serilog" Version="3.1.1" />'
+                "</ItemGroup><Choose><When Condition=\"'$(Configuration)' == 'Debug'\"><ItemGroup>"
+                '<PackageReference Include="Moq"><Version>4.20.70</Version></PackageReference>'
+                "</ItemGroup></When></Choose></Project>"
+            )
+        self.retriever._discover_nuget_dependencies()
+
+        nuget_deps = sorted((dep.name, dep.version) for dep in self.retriever._dependencies_info if dep.type == "nuget")
+        self.assertEqual(nuget_deps, [("Moq", "4.20.70"), ("Newtonsoft.Json", "13.0.3"), ("Serilog", "3.1.1")])
+
+    def test_project_files_are_reparsed_only_when_modified(self):
+        """Test that unchanged project files are not re-parsed after the cache was cleared."""
+        csproj_path = os.path.join(self.temp_dir, "App.csproj")
+        with open(csproj_path, "w") as f:
+            f.write('<Project><ItemGroup><PackageReference Include="Serilog" Version="3.1.1" /></ItemGroup></Project>')
+
+        with patch("serena.dependency_symbol.ET.iterparse", wraps=ET.iterparse) as mock_iterparse:
+            self.retriever._discover_nuget_dependencies()
+            self.retriever.clear_cache()
+            self.retriever._discover_nuget_dependencies()
+            self.assertEqual(mock_iterparse.call_count, 1)
+            self.assertEqual([dep.name for dep in self.retriever._dependencies_info], ["Serilog"])
+
+            os.utime(csproj_path, ns=(0, 0))
+            self.retriever.clear_cache()
+            self.retriever._discover_nuget_dependencies()
+            self.assertEqual(mock_iterparse.call_count, 2)
+
+            self.retriever.invalidate_parse_cache()
+            self.retriever.clear_cache()
+            self.retriever._discover_nuget_dependencies()
+            self.assertEqual(mock_iterparse.call_count, 3)
+
+    def test_nuget_assemblies_are_resolved_in_global_packages_folder(self):
+        """Test that NuGet packages are resolved to the assembly of the best matching target framework."""
+        nuget_root = os.path.join(self.temp_dir, "nuget")
+        for tfm in ("net462", "netstandard2.0", "net6.0", "net8.0"):
+            lib_dir = os.path.join(nuget_root, "newtonsoft.json", "13.0.3", "lib", tfm)
+            os.makedirs(lib_dir)
+            with open(os.path.join(lib_dir, "Newtonsoft.Json.dll"), "wb") as f:
+                f.write(b"MZ")
+        with open(os.path.join(self.temp_dir, "App.csproj"), "w") as f:
+            f.write(
+                '<Project Sdk="Microsoft.NET.Sdk"><PropertyGroup><TargetFrameworks>net6.0;net462</TargetFrameworks></PropertyGroup>'
+                '<ItemGroup><PackageReference Include="Newtonsoft.Json" Version="13.0.3" />'
+                '<PackageReference Include="Serilog" Version="3.1.1" /></ItemGroup></Project>'
+            )
+        with patch.dict(os.environ, {"NUGET_PACKAGES": nuget_root}):
+            self.retriever._discover_nuget_dependencies()
+
+        paths = {dep.name: dep.path for dep in self.retriever._dependencies_info}
+        self.assertEqual(
+            paths["Newtonsoft.Json"], os.path.join(nuget_root, "newtonsoft.json", "13.0.3", "lib", "net6.0", "Newtonsoft.Json.dll")
+        )
+        self.assertIsNone(paths["Serilog"])
+
+        # copies of the package's assembly (e.g. in a bin directory) are not discovered as separate DLLs
+        bin_dir = os.path.join(self.temp_dir, "bin")
+        os.makedirs(bin_dir)
+        shutil.copy2(paths["Newtonsoft.Json"], os.path.join(bin_dir, "Newtonsoft.Json.dll"))
+        self.retriever._discover_external_dlls()
+        self.assertNotIn("dll", [dep.type for dep in self.retriever._dependencies_info if dep.name == "Newtonsoft.Json"])
+
+    def test_nuget_versions_are_normalized(self):
+        """Test that NuGet packages referenced with non-normalized versions and unusual layouts are resolved."""
+        nuget_root = os.path.join(self.temp_dir, "nuget")
+        lib_dir = os.path.join(nuget_root, "serilog", "3.0.0-beta", "lib")
+        os.makedirs(lib_dir)
+        with open(os.path.join(lib_dir, "Serilog.dll"), "wb") as f:
+            f.write(b"MZ")
+
+        for version in ("3.0-Beta", "3.0.0.0-beta+sha.abc", "03.0.0-beta"):
+            self.assertEqual(_find_nuget_assembly(Path(nuget_root), "Serilog", version), os.path.join(lib_dir, "Serilog.dll"))
+        self.assertIsNone(_find_nuget_assembly(Path(nuget_root), "Serilog", "[3.0,4.0)"))
+
+    @patch('subprocess.Popen')
+    def test_find_dependency_symbols_with_decompiler(self, mock_popen):
         """Test finding symbols using the decompiler."""
         # Mock the output of `ilspycmd -l`
-        mock_subprocess_run.return_value.stdout = "NetPackageManager\nAnother.Type"
-        mock_subprocess_run.return_value.returncode = 0
-        
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter(["Class NetPackageManager\n", "Class Another.Type\n"])
+        proc.wait.return_value = 0
+
         symbols = self.retriever.find_dependency_symbols("NetPackageManager")
         self.assertEqual(len(symbols), 1)
         self.assertEqual(symbols[0].name, "NetPackageManager")
 
         # Verify that `ilspycmd -l` was called
         expected_cmd = [self.config.ilspycmd_path, "-l", "c,i,s,d,e", os.path.join(self.external_lib_path, "NetPackageManager.dll")]
-        mock_subprocess_run.assert_called_with(expected_cmd, capture_output=True, text=True, check=True)
+        mock_popen.assert_called_with(expected_cmd, stdout=subprocess.PIPE, stderr=ANY, text=True, env=ANY)
+        self.assertEqual(mock_popen.call_args.kwargs["env"]["DOTNET_gcServer"], "1")
+
+    def test_find_dependency_symbols_decompiles_only_matching_types(self):
+        """Test that type names and kinds are filtered before any type body is decompiled."""
+        decompiler = Mock()
+        decompiler.enumerate_types_with_kinds.return_value = [
+            ("Game.Net.NetPackageManager", "Class"),
+            ("Game.Net.INetPackageManager", "Interface"),
+            ("Game.Net.PackageType", "Enum"),
+        ]
+        decompiler.decompile_type_body.return_value = "public class NetPackageManager {}"
+        self.retriever._decompiler = decompiler
+        self.retriever._dependencies_info = [
+            DependencyInfo(
+                name="NetPackageManager",
+                version="unknown",
+                type="dll",
+                path=os.path.join(self.external_lib_path, "NetPackageManager.dll"),
+                assembly_name="NetPackageManager",
+            )
+        ]
+
+        symbols = self.retriever.find_dependency_symbols(
+            "PackageManager", include_body=True, substring_matching=True, include_kinds=[SymbolKind.Class]
+        )
+        self.assertEqual([s.name for s in symbols], ["NetPackageManager"])
+        self.assertEqual(symbols[0].body, "public class NetPackageManager {}")
+        decompiler.decompile_type_body.assert_called_once_with(self.retriever._dependencies_info[0].path, "Game.Net.NetPackageManager")
+
+    def test_find_dependency_symbols_async_enumerates_types_asynchronously(self):
+        """Test that the asynchronous search builds its index via the decompiler's asynchronous type enumeration."""
+        decompiler = Mock()
+        decompiler.enumerate_types_with_kinds_async = AsyncMock(
+            return_value=[("Game.Net.NetPackageManager", "Class"), ("Game.Net.INetPackageManager", "Interface")]
+        )
+        self.retriever._decompiler = decompiler
+        dependency = DependencyInfo(
+            name="NetPackageManager",
+            version="unknown",
+            type="dll",
+            path=os.path.join(self.external_lib_path, "NetPackageManager.dll"),
+            assembly_name="NetPackageManager",
+        )
+        self.retriever._dependencies_info = [dependency]
+
+        symbols = asyncio.run(
+            self.retriever.find_dependency_symbols_async("PackageManager", substring_matching=True, include_kinds=[SymbolKind.Interface])
+        )
+        self.assertEqual([s.name for s in symbols], ["INetPackageManager"])
+        decompiler.enumerate_types_with_kinds_async.assert_awaited_once_with(dependency.path)
+        decompiler.enumerate_types_with_kinds.assert_not_called()
+
+    def test_symbol_index_enumerates_included_dependencies_concurrently(self):
+        """Test that dependencies excluded by a query are not enumerated and that included ones are enumerated concurrently."""
+        dll_paths = [os.path.join(self.external_lib_path, f"Game{i}.dll") for i in range(2)]
+        nuget_path = os.path.join(self.temp_dir, "Newtonsoft.Json.dll")
+        for path in dll_paths + [nuget_path]:
+            with open(path, "wb") as f:
+                f.write(b"MZ" + path.encode())
+        # enumerating the DLLs one after another would break the barrier
+        barrier = threading.Barrier(len(dll_paths), timeout=5)
+
+        def enumerate_types_with_kinds(path):
+            if path != nuget_path:
+                barrier.wait()
+            return [("Game.JsonGameConverter" if path == nuget_path else f"Game.{os.path.basename(path)[:-4]}", "Class")]
+
+        decompiler = Mock()
+        decompiler.enumerate_types_with_kinds.side_effect = enumerate_types_with_kinds
+        self.retriever._decompiler = decompiler
+        self.retriever._dependencies_info = [DependencyInfo(name="Newtonsoft.Json", version="13.0.3", type="nuget", path=nuget_path)] + [
+            DependencyInfo(name=f"Game{i}", version="unknown", type="dll", path=path) for i, path in enumerate(dll_paths)
+        ]
+
+        symbols = self.retriever.find_dependency_symbols("Game", substring_matching=True, include_external_dlls=False)
+        self.assertEqual([s.name for s in symbols], ["JsonGameConverter"])
+        decompiler.enumerate_types_with_kinds.assert_called_once_with(nuget_path)
+
+        symbols = self.retriever.find_dependency_symbols("Game", substring_matching=True)
+        self.assertEqual([s.name for s in symbols], ["JsonGameConverter", "Game0", "Game1"])
+        self.assertEqual(decompiler.enumerate_types_with_kinds.call_count, 3)
+
+    def test_exact_search_skips_dependencies_without_matching_placeholders(self):
+        """Test that exact-name searches do not retrieve the symbols of dependencies which cannot match."""
+        config = DependencySymbolConfig(decompilation_enabled=False, disk_cache_dir=self.config.disk_cache_dir)
+        retriever = DependencySymbolRetriever(self.project, config)
+        retriever._dependencies_info = [
+            DependencyInfo(name="Serilog", version="3.1.1", type="nuget"),
+            DependencyInfo(
+                name="NetPackageManager",
+                version="unknown",
+                type="dll",
+                path=os.path.join(self.external_lib_path, "NetPackageManager.dll"),
+                assembly_name="NetPackageManager",
+            ),
+        ]
+
+        with patch.object(retriever, "_get_dependency_symbols", wraps=retriever._get_dependency_symbols) as mock_get_symbols:
+            self.assertEqual(retriever.find_dependency_symbols("Missing"), [])
+            mock_get_symbols.assert_not_called()
+            symbols = retriever.find_dependency_symbols("netpackagemanager")
+        self.assertEqual([s.name for s in symbols], ["NetPackageManager"])
+        mock_get_symbols.assert_called_once_with(retriever._dependencies_info[1], False)
+
+    def test_dll_deleted_after_discovery_is_skipped(self):
+        """Test that a DLL which was deleted after discovery does not break the search."""
+        self.retriever.list_dependencies()
+        os.remove(os.path.join(self.external_lib_path, "NetPackageManager.dll"))
+
+        self.assertEqual(self.retriever.find_dependency_symbols("NetPackageManager"), [])
+
+    def test_type_enumeration_is_persisted_on_disk(self):
+        """Test that type enumeration results are reused by a new retriever for an unchanged DLL."""
+        decompiler = Mock()
+        decompiler.enumerate_types_with_kinds.return_value = [("Game.Net.NetPackageManager", "Class")]
+        dependency = DependencyInfo(
+            name="NetPackageManager",
+            version="unknown",
+            type="dll",
+            path=os.path.join(self.external_lib_path, "NetPackageManager.dll"),
+            assembly_name="NetPackageManager",
+        )
+        self.retriever._decompiler = decompiler
+        self.assertEqual(self.retriever._list_types(dependency), [("Game.Net.NetPackageManager", SymbolKind.Class)])
+
+        other_retriever = DependencySymbolRetriever(self.project, self.config)
+        other_retriever._decompiler = Mock()
+        self.assertEqual(other_retriever._list_types(dependency), [("Game.Net.NetPackageManager", SymbolKind.Class)])
+        other_retriever._decompiler.enumerate_types_with_kinds.assert_not_called()
+
+        # entries are not shared between configurations reporting different types
+        private_config = DependencySymbolConfig(include_private_members=True, disk_cache_dir=self.config.disk_cache_dir)
+        private_retriever = DependencySymbolRetriever(self.project, private_config)
+        private_retriever._decompiler = Mock()
+        private_retriever._decompiler.enumerate_types_with_kinds.return_value = [
+            ("Game.Net.NetPackageManager", "Class"),
+            ("Game.Net.PacketBuffer", "Struct"),
+        ]
+        self.assertEqual(len(private_retriever._list_types(dependency)), 2)
 
     def test_config_validation(self):
         """Test configuration validation."""
@@ -109,6 +417,316 @@ class TestDependencySymbolRetriever(unittest.TestCase):
         with self.assertRaises(ValueError):
             invalid_config.validate()
 
+        invalid_config = DependencySymbolConfig(scan_workers=0)
+        with self.assertRaises(ValueError):
+            invalid_config.validate()
+
+        invalid_config = DependencySymbolConfig(cache_max_entries=0)
+        with self.assertRaises(ValueError):
+            invalid_config.validate()
+
+    def test_config_is_immutable_and_hashable(self):
+        """Test that configurations can be shared and used as cache keys."""
+        config = DependencySymbolConfig(external_search_paths=["/game/Managed"])
+        self.assertEqual(config.external_search_paths, ("/game/Managed",))
+        self.assertEqual(hash(config), hash(DependencySymbolConfig(external_search_paths=("/game/Managed",))))
+        with self.assertRaises(AttributeError):
+            config.max_results = 5
+
+
+class TestFindDependencySymbolTool(unittest.TestCase):
+    """Test cases for FindDependencySymbolTool."""
+
+    def setUp(self):
+        self.retriever = Mock()
+        self.tool = FindDependencySymbolTool(agent=Mock(dependency_symbol_retriever=self.retriever))
+
+    @staticmethod
+    def _make_symbol(name: str, body: str):
+        symbol = Mock(body=body)
+        symbol.to_dict.return_value = {
+            "name": name,
+            "name_path": f"Game.Net.{name}",
+            "kind": "Class",
+            "body": body,
+            "location": {"relative_path": "external_libs/NetPackageManager.dll"},
+        }
+        return symbol
+
+    def test_result_is_serialized_compactly(self):
+        """Test that results are serialized without whitespace and non-ASCII escaping, with symbol kinds parsed from integers."""
+        self.retriever.find_dependency_symbols.return_value = [self._make_symbol("Größe", "public class Größe {}")]
+
+        result = self.tool.apply("Größe", include_body=True, include_kinds=[int(SymbolKind.Class)])
+        self.assertEqual(
+            result,
+            '[{"name_path":"Game.Net.Größe","kind":"Class","body":"public class Größe {}",'
+            '"relative_path":"external_libs/NetPackageManager.dll"}]',
+        )
+        self.retriever.find_dependency_symbols.assert_called_once_with(
+            "Größe",
+            include_body=True,
+            include_kinds=frozenset({SymbolKind.Class}),
+            exclude_kinds=None,
+            substring_matching=False,
+            include_nuget=True,
+            include_external_dlls=True,
+        )
+
+    def test_result_within_limit_is_returned(self):
+        """Test that a result with bodies which fits into max_answer_chars is returned in full."""
+        self.retriever.find_dependency_symbols.return_value = [self._make_symbol("NetPackageManager", "x" * 50)]
+
+        result = self.tool.apply("NetPackageManager", include_body=True, max_answer_chars=1000)
+        self.assertEqual([s["body"] for s in json.loads(result)], ["x" * 50])
+
+    def test_too_long_bodies_are_rejected_before_serialization(self):
+        """Test that results whose bodies alone exceed max_answer_chars are rejected without serializing the symbols."""
+        symbols = [self._make_symbol(f"Type{i}", "x" * 50) for i in range(3)]
+        self.retriever.find_dependency_symbols.return_value = symbols
+
+        result = self.tool.apply("Type", include_body=True, substring_matching=True, max_answer_chars=100)
+        self.assertTrue(result.startswith("The answer is too long (more than 150 characters)."))
+        for symbol in symbols:
+            symbol.to_dict.assert_not_called()
+
+
+    def test_clear_cache_clears_the_shared_retriever(self):
+        """Test that the dependency cache is cleared on the agent's retriever, which is shared by all tool calls."""
+        ClearDependencyCacheTool(agent=self.tool.agent).apply()
+        self.retriever.clear_cache.assert_called_once_with()
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test cases for _DiskCache."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache directory is only scanned once its tracked size exceeds the budget."""
+        # each entry takes about 85 bytes, such that four entries fit into the budget
+        cache = _DiskCache(self.cache_dir, ttl_seconds=3600, max_bytes=350)
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            for i in range(4):
+                cache.put(f"key{i}", "x" * 40)
+                os.utime(cache._entry_path(f"key{i}"), (i, i))
+            self.assertEqual(mock_scandir.call_count, 1)
+            self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+            cache.put("key4", "x" * 40)
+            self.assertEqual(mock_scandir.call_count, 2)
+        # the cache is shrunk to 90% of its budget
+        self.assertIsNone(cache.get("key0"))
+        self.assertIsNone(cache.get("key1"))
+        self.assertEqual(cache.get("key2"), "x" * 40)
+        self.assertEqual(cache.get("key4"), "x" * 40)
+
+    def test_stale_temporary_files_are_removed(self):
+        """Test that temporary files left behind by interrupted writes are removed when the directory is scanned."""
+        stale_path = os.path.join(self.cache_dir, "key.json.123.tmp")
+        with open(stale_path, "w") as f:
+            f.write("{")
+        os.utime(stale_path, (0, 0))
+
+        _DiskCache(self.cache_dir, ttl_seconds=3600, max_bytes=1000).put("key", [])
+        self.assertEqual(os.listdir(self.cache_dir), ["key.json"])
+
+
+class TestSymbolIndex(unittest.TestCase):
+    """Test cases for the symbol index over enumerated types."""
+
+    def test_query(self):
+        dependency = DependencyInfo(name="Game", version="unknown", type="dll", path="Game.dll")
+        index = _SymbolIndex(
+            [
+                (dependency, "Game.Net.NetPackageManager", SymbolKind.Class),
+                (dependency, "Game.Net.PackageType", SymbolKind.Enum),
+                (dependency, "Game.World", SymbolKind.Class),
+            ]
+        )
+        self.assertEqual(index.query("netpackagemanager", substring_matching=False), [0])
+        self.assertEqual(index.query("Package", substring_matching=True), [0, 1])
+        self.assertEqual(index.query("Missing", substring_matching=True), [])
+        self.assertEqual(list(index.query("or", substring_matching=True)), [0, 1, 2])
+
+
+class TestIlSpyDecompiler(unittest.TestCase):
+    """Test cases for IlSpyDecompiler."""
+
+    @staticmethod
+    def _write_project_output(cmd, **kwargs):
+        """Simulates `ilspycmd -p -o <dir>` by writing a project layout to the output directory."""
+        output_dir = cmd[cmd.index("-o") + 1]
+        os.makedirs(os.path.join(output_dir, "Game.Net"))
+        os.makedirs(os.path.join(output_dir, "Properties"))
+        with open(os.path.join(output_dir, "Game.Net", "NetPackageManager.cs"), "w") as f:
+            f.write("public class NetPackageManager {}")
+        with open(os.path.join(output_dir, "Properties", "AssemblyInfo.cs"), "w") as f:
+            f.write("[assembly: AssemblyVersion(\"1.0\")]")
+        with open(os.path.join(output_dir, "Game.csproj"), "w") as f:
+            f.write("<Project />")
+        return Mock(returncode=0, stdout="")
+
+    @patch("subprocess.run")
+    def test_decompile_type_body_uses_single_project_decompilation(self, mock_subprocess_run):
+        """Test that all type bodies of an assembly are obtained from a single ilspycmd invocation."""
+        mock_subprocess_run.side_effect = self._write_project_output
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+
+        body = decompiler.decompile_type_body("Game.dll", "Game.Net.NetPackageManager")
+        self.assertEqual(body, "public class NetPackageManager {}")
+        decompiler.decompile_type_body("Game.dll", "Game.Net.NetPackageManager")
+        self.assertEqual(mock_subprocess_run.call_count, 1)
+
+    @patch("subprocess.run")
+    def test_rebuilt_assembly_is_decompiled_again(self, mock_subprocess_run):
+        """Test that the memoized type bodies of an assembly are not used once the assembly file has changed."""
+        mock_subprocess_run.side_effect = self._write_project_output
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assembly_path = os.path.join(temp_dir, "Game.dll")
+            with open(assembly_path, "wb") as f:
+                f.write(b"MZ")
+
+            decompiler.decompile_type_body(assembly_path, "Game.Net.NetPackageManager")
+            with open(assembly_path, "wb") as f:
+                f.write(b"MZ rebuilt")
+            decompiler.decompile_type_body(assembly_path, "Game.Net.NetPackageManager")
+        self.assertEqual(mock_subprocess_run.call_count, 2)
+
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_type_kinds_are_retained_after_project_decompilation(self, mock_subprocess_run, mock_popen):
+        """Test that types are enumerated with their kinds even if the assembly's bodies were already decompiled."""
+        mock_subprocess_run.side_effect = self._write_project_output
+        mock_popen.return_value.__enter__.return_value.stdout = iter(["Interface Game.Net.INetPackageManager\n"])
+        mock_popen.return_value.__enter__.return_value.wait.return_value = 0
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+
+        decompiler.decompile_type_body("Game.dll", "Game.Net.NetPackageManager")
+        self.assertEqual(decompiler.enumerate_types_with_kinds("Game.dll"), [("Game.Net.INetPackageManager", "Interface")])
+
+    @patch("subprocess.run")
+    def test_failed_project_decompilation_is_not_retried(self, mock_subprocess_run):
+        """Test that types are decompiled individually once project-mode decompilation of their assembly failed."""
+
+        def run(cmd, **kwargs):
+            if "-p" in cmd:
+                raise subprocess.CalledProcessError(1, cmd)
+            return Mock(returncode=0, stdout=f"// {cmd[cmd.index('-t') + 1]}")
+
+        mock_subprocess_run.side_effect = run
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+
+        self.assertEqual(decompiler.decompile_type_body("Game.dll", "Game.A"), "// Game.A")
+        self.assertEqual(decompiler.decompile_type_body("Game.dll", "Game.B"), "// Game.B")
+        project_calls = [call for call in mock_subprocess_run.call_args_list if "-p" in call.args[0]]
+        self.assertEqual(len(project_calls), 1)
+
+    @patch("asyncio.create_subprocess_exec")
+    def test_enumerate_types_with_kinds_async(self, mock_create_subprocess_exec):
+        """Test that the asynchronous type enumeration parses the type listing of ilspycmd."""
+        proc = Mock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b"Class Game.Net.NetPackageManager\nInterface Game.Net.INetPackageManager\n", b""))
+        mock_create_subprocess_exec.return_value = proc
+        decompiler = IlSpyDecompiler(ilspycmd_path="ilspycmd")
+
+        types = asyncio.run(decompiler.enumerate_types_with_kinds_async("Game.dll"))
+        self.assertEqual(types, [("Game.Net.NetPackageManager", "Class"), ("Game.Net.INetPackageManager", "Interface")])
+        mock_create_subprocess_exec.assert_called_once_with("ilspycmd", "-l", "c,i,s,d,e", "Game.dll", stdout=ANY, stderr=ANY, env=ANY)
+
+
+def build_assembly(type_refs, type_defs):
+    """
+    Builds a minimal PE image whose ECMA-335 metadata contains the given type references and definitions.
+
+    :param type_refs: (namespace, name) pairs
+    :param type_defs: (flags, namespace, name, extends) tuples, where extends is the 1-based TypeRef row (0 for none)
+    """
+    strings = bytearray(b"\0")
+
+    def string(value):
+        strings.extend(value.encode() + b"\0")
+        return len(strings) - len(value) - 1
+
+    module_row = struct.pack("<HHHHH", 0, string("Test.dll"), 1, 0, 0)
+    type_ref_rows = b"".join(struct.pack("<HHH", 0, string(name), string(namespace)) for namespace, name in type_refs)
+    type_def_rows = b"".join(
+        struct.pack("<IHHHHH", flags, string(name), string(namespace), extends << 2 | 1 if extends else 0, 1, 1)
+        for flags, namespace, name, extends in type_defs
+    )
+    tables = struct.pack("<IBBBBQQ", 0, 2, 0, 0, 1, 0b111, 0) + struct.pack("<III", 1, len(type_refs), len(type_defs))
+    tables += module_row + type_ref_rows + type_def_rows
+    tables += b"\0" * (-len(tables) % 4)
+    strings.extend(b"\0" * (-len(strings) % 4))
+
+    version = b"v4.0.30319\0\0"
+    stream_headers_size = 2 * 8 + 4 + 12
+    streams_offset = 16 + len(version) + 4 + stream_headers_size
+    metadata = struct.pack("<IHHII", 0x424A5342, 1, 1, 0, len(version)) + version + struct.pack("<HH", 0, 2)
+    metadata += struct.pack("<II", streams_offset, len(tables)) + b"#~\0\0"
+    metadata += struct.pack("<II", streams_offset + len(tables), len(strings)) + b"#Strings\0\0\0\0"
+    metadata += tables + strings
+
+    section_rva, section_offset, cli_header_size = 0x1000, 0x200, 72
+    section = struct.pack("<III", cli_header_size, 0, section_rva + cli_header_size).ljust(cli_header_size, b"\0") + metadata
+    pe_offset, optional_header_size = 0x80, 224
+    image = bytearray(section_offset + len(section))
+    struct.pack_into("<I", image, 0x3C, pe_offset)
+    image[pe_offset : pe_offset + 4] = b"PE\0\0"
+    struct.pack_into("<HH", image, pe_offset + 4, 0x14C, 1)
+    struct.pack_into("<H", image, pe_offset + 20, optional_header_size)
+    struct.pack_into("<H", image, pe_offset + 24, 0x10B)
+    struct.pack_into("<II", image, pe_offset + 24 + 96 + 14 * 8, section_rva, cli_header_size)
+    struct.pack_into("<IIII", image, pe_offset + 24 + optional_header_size + 8, len(section), section_rva, len(section), section_offset)
+    image[section_offset:] = section
+    return bytes(image)
+
+
+class TestCecilDecompiler(unittest.TestCase):
+    """Test cases for CecilDecompiler."""
+
+    ASSEMBLY = build_assembly(
+        type_refs=[("System", "Object"), ("System", "Enum"), ("System", "ValueType"), ("System", "MulticastDelegate")],
+        type_defs=[
+            (0x00, "", "<Module>", 0),
+            (0xA1, "Game.Net", "INetPackageManager", 0),
+            (0x101, "Game.Net", "NetPackageManager`1", 1),
+            (0x101, "Game.Net", "PackageState", 2),
+            (0x109, "Game.Net", "PackageInfo", 3),
+            (0x101, "Game.Net", "PackageHandler", 4),
+            (0x100, "Game.Net", "InternalHelper", 1),
+            (0x102, "Game.Net", "NestedType", 1),
+        ],
+    )
+
+    def test_read_type_definitions(self):
+        """Test that the public top-level types of an assembly are read along with their kinds."""
+        self.assertEqual(
+            read_type_definitions(self.ASSEMBLY),
+            [
+                ("Game.Net.INetPackageManager", "Interface"),
+                ("Game.Net.NetPackageManager", "Class"),
+                ("Game.Net.PackageState", "Enum"),
+                ("Game.Net.PackageInfo", "Struct"),
+                ("Game.Net.PackageHandler", "Delegate"),
+            ],
+        )
+        self.assertIn(("Game.Net.InternalHelper", "Class"), read_type_definitions(self.ASSEMBLY, include_non_public=True))
+
+    def test_enumerate_types_of_invalid_assembly(self):
+        """Test that files which are not .NET assemblies yield no types."""
+        with tempfile.NamedTemporaryFile(suffix=".dll", delete=False) as f:
+            f.write(b"MZ" + b"\0" * 128)
+        try:
+            self.assertEqual(CecilDecompiler().enumerate_types(f.name), [])
+        finally:
+            os.remove(f.name)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file